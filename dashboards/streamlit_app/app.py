@@ -4,7 +4,32 @@ import altair as alt
 import numpy as np
 import subprocess
 import datetime
+import functools
+import json
 import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from scripts.analysis.forecast import forecast_linear
+from scripts.analysis.monte_carlo import FACTORS, fit_factor_model, simulate_portfolio, summarize
+from scripts.analysis.regimes import build_regime_cube
+from scripts.analysis.scenarios import EPISODES, run_scenarios
+from scripts.data_pipeline.dashboard_charts import (
+    FRED_SERIES,
+    asset_overlay_chart,
+    asset_overlay_frame,
+    correlation_chart,
+    correlation_long,
+    fred_trend_chart,
+    kpi_values,
+    worldbank_chart,
+)
+from scripts.data_pipeline.dashboard_snapshot import export_snapshot, load_snapshot
+from scripts.data_pipeline.intraday import IntradayEngine, IntradayFeed, ReplaySource, synthetic_ticks
+from scripts.data_pipeline.load_local_data import data_version, merge_with_asset
+from scripts.data_pipeline.series_store import build_series_store
+from scripts.utils_tracing import collecting, span, start_trace, stop_trace, to_jsonl
 
 # ===================================================================
 # ==========  AUTO REFRESH LOGIC  ===================================
@@ -48,7 +73,8 @@ def check_auto_refresh():
 def do_refresh_all_data():
     """
     Calls your fetch scripts to update local CSV files in data/raw/,
-    then clears cache so we re-read them. 
+    then clears cache so we re-read them and exports the static snapshot
+    of the default view for the new data.
     """
     # Example calls:
     # NOTE: Adjust as needed if your scripts are in a different location or use different names.
@@ -57,6 +83,8 @@ def do_refresh_all_data():
     # subprocess.run(["python", "scripts/data_pipeline/fetch_worldbank_data.py"])
     # subprocess.run(["python", "scripts/data_pipeline/fetch_yahoo_data.py"])
     st.cache_data.clear()
+    st.cache_resource.clear()
+    export_snapshot(get_series_store())
 
 # ===================================================================
 # ==========  LOAD CORRELATION CSV  =================================
@@ -68,84 +96,325 @@ def load_correlation_matrices():
     return pearson, spearman
 
 # ===================================================================
-# ==========  LOAD FRED CSV  ========================================
+# ==========  LOAD FACTOR (PCA) CSV  ================================
 # ===================================================================
 @st.cache_data
-def load_fred_csv():
+def load_factor_outputs():
     """
-    Reads the CSV files that your fetch_fred_data.py script would generate 
-    in data/raw/fred (like fred_cpiaucns.csv, fred_gdp.csv, etc.).
+    Loadings and explained variance written by scripts/analysis/factors.py.
     """
-    cpi = pd.read_csv("data/raw/fred/fred_cpiaucns.csv", parse_dates=["date"])
-    gdp = pd.read_csv("data/raw/fred/fred_gdp.csv", parse_dates=["date"])
-    unrate = pd.read_csv("data/raw/fred/fred_unrate.csv", parse_dates=["date"])
-    cli = pd.read_csv("data/raw/fred/fred_usslind.csv", parse_dates=["date"])
+    loadings = pd.read_csv("data/processed/factor_loadings.csv", index_col=0)
+    variance = pd.read_csv("data/processed/factor_explained_variance.csv", index_col=0)
+    return loadings, variance
 
-    return cpi, gdp, unrate, cli
+# ===================================================================
+# ==========  LOAD LEAD-LAG REGRESSION CSV  =========================
+# ===================================================================
+@st.cache_data
+def load_lead_lag_table():
+    """
+    Coefficient / t-stat table written by scripts/analysis/lead_lag.py.
+    """
+    return pd.read_csv("data/processed/lead_lag_regressions.csv")
+
+# ===================================================================
+# ==========  SHARED SERIES STORE  ==================================
+# ===================================================================
+@st.cache_resource
+def get_series_store():
+    """
+    Loads every CSV once per process into a read-only SeriesStore shared by all
+    sessions. The loaders below hand out views into it, not per-rerun copies.
+    """
+    with span("store.build"):
+        return build_series_store()
+
+# ===================================================================
+# ==========  LOAD FRED CSV  ========================================
+# ===================================================================
+def load_fred_csv():
+    """
+    The FRED series written by fetch_fred_data.py to data/raw/fred
+    (fred_cpiaucns.csv, fred_gdp.csv, ...), as date/value views from the store.
+    """
+    store = get_series_store()
+    return tuple(store.series(series_id) for series_id, _, _ in FRED_SERIES.values())
 
 # ===================================================================
 # ==========  LOAD YAHOO CSV  =======================================
 # ===================================================================
-@st.cache_data
 def load_yahoo_csv():
     """
-    Merges each yahoo CSV (sp500.csv, gold.csv, etc.) into one DataFrame with columns:
+    Each yahoo CSV (sp500.csv, gold.csv, etc.) aligned into one DataFrame with columns:
         date, sp500, gold, bond10y, ...
     """
-    import glob
-    path = "data/raw/yahoo"
-    all_files = glob.glob(os.path.join(path, "*.csv"))
-    dfs = []
-
-    for f in all_files:
-        label = os.path.splitext(os.path.basename(f))[0]  # e.g. sp500, gold, etc.
-        df_ = pd.read_csv(f, parse_dates=["date"])
-        df_.rename(columns={"adj_close": label}, inplace=True)
-        dfs.append(df_)
-
-    merged = None
-    for df_ in dfs:
-        if merged is None:
-            merged = df_
-        else:
-            merged = pd.merge(merged, df_, on="date", how="outer")
+    return get_series_store().panel("yahoo")
+
+# ===================================================================
+# ==========  INTRADAY FEED (background thread)  ====================
+# ===================================================================
+LIVE_REFRESH_SECONDS = 2
 
-    return merged.dropna()
+@st.cache_resource(on_release=lambda feed: feed.stop())
+def get_intraday_feed():
+    """
+    One replayed intraday feed per process: a synthetic tick tape starting from
+    the latest Yahoo closes, replayed at 30x into an IntradayEngine on a
+    background thread. Bars are compacted into the shared store as "intraday"
+    (not to disk, since the ticks are synthetic). Clearing the cache (the
+    refresh buttons, or turning the feed off) stops the thread.
+    """
+    prices = load_yahoo_csv().set_index("date").ffill()
+    engine = IntradayEngine(prices.columns, bar_seconds=30, window=120)
+    ticks = synthetic_ticks(prices.iloc[-1].to_dict(), ticks_per_minute=60)
+    source = ReplaySource(ticks, speed=30, loop=True)
+    return IntradayFeed(engine, source, compact_every=30, out_dir=None, store=get_series_store()).start()
 
 # ===================================================================
 # ==========  LOAD WORLD BANK CSV  ==================================
 # ===================================================================
-@st.cache_data 
 def load_worldbank_csv():
     """
-    Your fetch_worldbank_data.py presumably saves 'data/raw/worldbank/worldbank_us_macro.csv'.
+    'data/raw/worldbank/worldbank_us_macro.csv' from fetch_worldbank_data.py.
+    """
+    return get_series_store().panel("worldbank")
+
+# ===================================================================
+# ==========  SCENARIO RESULTS  =====================================
+# ===================================================================
+@st.cache_data
+def get_scenario_results(episode_names, universe):
+    """
+    Runs the scenario engine for the selected episodes/assets. Cached on the
+    (episodes, universe) pair so reruns don't recompute.
     """
-    wb = pd.read_csv("data/raw/worldbank/worldbank_us_macro.csv", parse_dates=["date"])
-    return wb
+    cpi, gdp, unrate, cli = load_fred_csv()
+    macro = pd.concat({
+        "CPI": cpi.set_index("date")["value"],
+        "GDP": gdp.set_index("date")["value"],
+        "Unemployment": unrate.set_index("date")["value"],
+        "CLI": cli.set_index("date")["value"],
+    }, axis=1).sort_index()
+    prices = load_yahoo_csv().set_index("date").sort_index()
+    episodes = {name: EPISODES[name] for name in episode_names}
+    return run_scenarios(prices, macro, episodes=episodes, universe=list(universe))
 
 # ===================================================================
-# ==========  FORECAST FUNCTION  ====================================
+# ==========  MONTE CARLO SHOCK SIMULATION  =========================
 # ===================================================================
-def forecast_linear(df, months=12):
-    from sklearn.linear_model import LinearRegression
-    df = df.dropna().copy()
-    df['timestamp'] = df['date'].map(pd.Timestamp.toordinal)
+@st.cache_resource
+def get_factor_model():
+    """
+    Fits the macro factor model once per process (FRED changes -> asset returns).
+    """
+    cpi, gdp, unrate, cli = load_fred_csv()
+    macro = pd.concat({
+        "CPIAUCNS": cpi.set_index("date")["value"],
+        "UNRATE": unrate.set_index("date")["value"],
+        "USSLIND": cli.set_index("date")["value"],
+    }, axis=1).sort_index()
+    prices = load_yahoo_csv().set_index("date").sort_index()
+    return fit_factor_model(macro, prices)
 
-    X = df['timestamp'].values.reshape(-1, 1)
-    y = df['value'].values
-    model = LinearRegression().fit(X, y)
+@st.cache_data
+def get_shock_simulation(shock, selected_assets, n_paths, horizon, seed=0):
+    """
+    Simulates the equal-weighted portfolio of `selected_assets` under `shock`
+    (a tuple of (factor, size) pairs). Returns summary stats and a histogram
+    of total returns, so the chart never ships the raw paths.
+    """
+    model = get_factor_model()
+    weights = np.array([1.0 if a in selected_assets else 0.0 for a in model.assets])
+    weights /= weights.sum()
 
-    future_dates = pd.date_range(start=df['date'].max(), periods=months+1, freq='M')[1:]
-    future_ordinals = future_dates.map(pd.Timestamp.toordinal).values.reshape(-1, 1)
-    future_preds = model.predict(future_ordinals)
+    totals, drawdowns = simulate_portfolio(model, dict(shock), weights, n_paths, horizon, seed)
+    baseline, _ = simulate_portfolio(model, {}, weights, n_paths, horizon, seed)
 
-    forecast_df = pd.DataFrame({'date': future_dates, 'value': future_preds})
-    return pd.concat([df[['date','value']], forecast_df])
+    counts, edges = np.histogram(np.concatenate([totals, baseline]), bins=60)
+    hist = pd.concat([
+        pd.DataFrame({"Scenario": name, "return": (edges[:-1] + edges[1:]) / 2,
+                      "count": np.histogram(values, bins=edges)[0]})
+        for name, values in [("Shocked", totals), ("Baseline", baseline)]
+    ])
+    return summarize(totals, drawdowns), summarize(baseline), hist
+
+# ===================================================================
+# ==========  REGIME CUBE  ==========================================
+# ===================================================================
+@st.cache_resource
+def get_regime_cube():
+    """
+    Precomputes regime labels and conditional stats for every
+    indicator x regime x asset cell; widgets only slice the result.
+    """
+    cpi, gdp, unrate, cli = load_fred_csv()
+    macro = pd.concat({
+        "CPIAUCNS": cpi.set_index("date")["value"],
+        "GDP": gdp.set_index("date")["value"],
+        "UNRATE": unrate.set_index("date")["value"],
+        "USSLIND": cli.set_index("date")["value"],
+    }, axis=1).sort_index()
+    prices = load_yahoo_csv().set_index("date").sort_index()
+    return build_regime_cube(macro, prices)
+
+# ===================================================================
+# ==========  SECTION DATA (cached per explicit input)  =============
+# ===================================================================
+def get_chart_data(indicator, start=None, end=None):
+    """
+    View of the indicator between start and end (searchsorted on the sorted
+    dates; no copy), plus its chart label and unit.
+    """
+    series_id, label, unit = FRED_SERIES[indicator]
+    return get_series_store().series(series_id, start, end), label, unit
+
+def get_indicator_frame(indicator, start, end, smooth, forecast):
+    """
+    The filtered (and optionally smoothed / forecast) indicator shared by the
+    FRED trend and asset overlay sections. The plain filter is returned as the
+    store's view, uncached: st.cache_data would hand back a fresh unpickled
+    copy on every rerun.
+    """
+    if smooth or forecast:
+        return get_derived_indicator_frame(indicator, start, end, smooth, forecast)
+    with span("data.indicator_frame") as sp:
+        df, label, unit = get_chart_data(indicator, start, end)
+        sp.set(rows=len(df), payload=df)
+    return df, label, unit
+
+@st.cache_data
+def get_derived_indicator_frame(indicator, start, end, smooth, forecast):
+    """
+    Smoothed and / or forecast indicator; these are new frames, so they are
+    worth caching.
+    """
+    with span("data.indicator_frame") as sp:
+        df, label, unit = get_chart_data(indicator, start, end)
+        if smooth:
+            df = df.assign(value=df['value'].rolling(window=7).mean())
+        if forecast:
+            df = forecast_linear(df)
+        sp.set(rows=len(df), payload=df)
+    return df, label, unit
+
+@st.cache_data
+def get_asset_overlay(indicator, start, end, smooth, forecast, asset):
+    """
+    Correlation of the indicator with one asset plus the long-format overlay.
+    """
+    df, _, _ = get_indicator_frame(indicator, start, end, smooth, forecast)
+    with span("data.asset_overlay") as sp:
+        correlation, overlay = asset_overlay_frame(merge_with_asset(df, load_yahoo_csv(), asset), asset)
+        sp.set(rows=len(overlay), payload=overlay)
+    return correlation, overlay
+
+@st.cache_data
+def get_correlation_long(corr_type, selected_vars):
+    """
+    Melted sub-matrix for the heatmap, cached per (type, variable selection).
+    """
+    pearson_corr, spearman_corr = load_correlation_matrices()
+    corr_matrix = pearson_corr if corr_type=="Pearson" else spearman_corr
+    with span("data.correlation_long") as sp:
+        filtered = correlation_long(corr_matrix, selected_vars)
+        sp.set(rows=len(filtered), payload=filtered)
+    return filtered
+
+# ===================================================================
+# ==========  STATIC SNAPSHOT (default view)  =======================
+# ===================================================================
+@st.cache_data
+def get_snapshot(version):
+    """
+    Prerendered default view written by dashboard_snapshot.py for this data
+    version. If the data changed without an export (e.g. the fetch scripts ran
+    outside the app), it is exported here once, so later visits get the fast
+    path. The export reads the files afresh rather than using the cached store,
+    which may predate the change.
+    """
+    snapshot = load_snapshot(version)
+    if snapshot is None:
+        try:
+            export_snapshot()
+        except OSError:
+            return None      # read-only deployment: fall back to the live path
+        snapshot = load_snapshot(version)
+    return snapshot
+
+def snapshot_panel(name, is_default):
+    """
+    A section's prerendered panel, only while its controls are at their defaults.
+    """
+    if snapshot is None or not is_default:
+        return None
+    return snapshot["panels"].get(name)
+
+# ===================================================================
+# ==========  PERFORMANCE TRACING  ==================================
+# ===================================================================
+def timed_section(name):
+    """
+    Times a dashboard section. A fragment rerunning on its own happens outside
+    the full-script trace, so its spans are collected separately and shown in
+    the overlay on the next full run.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not st.session_state.get("perf_overlay") or collecting():
+                with span(name):
+                    return func(*args, **kwargs)
+            start_trace()
+            try:
+                with span(name):
+                    return func(*args, **kwargs)
+            finally:
+                st.session_state["perf_fragment_spans"] = stop_trace()
+        return wrapper
+    return decorator
+
+def render_chart(name, chart, **kwargs):
+    """
+    st.altair_chart inside a span; the spec is only serialized for its size
+    while tracing.
+    """
+    with span(f"chart.{name}") as sp:
+        if sp:
+            rows = len(chart.data) if isinstance(chart.data, pd.DataFrame) else None
+            sp.set(rows=rows, payload=json.dumps(chart.to_dict(), default=str))
+        st.altair_chart(chart, **kwargs)
+
+def render_spec(name, spec, **kwargs):
+    """
+    A prerendered Vega-Lite spec from the snapshot, drawn without building or
+    serializing an Altair chart.
+    """
+    with span(f"chart.{name}.snapshot") as sp:
+        if sp:
+            sp.set(payload=json.dumps(spec))
+        st.vega_lite_chart(spec, **kwargs)
+
+def spans_frame(spans):
+    """Overlay table: one row per span in start order, nested names indented by depth."""
+    spans = sorted(spans, key=lambda s: s["start"])
+    return pd.DataFrame({
+        "span": ["\u00a0\u00a0" * s["depth"] + s["name"] for s in spans],
+        "ms": [s["wall_ms"] for s in spans],
+        "rows": [s["rows"] for s in spans],
+        "KB": [None if s["bytes"] is None else round(s["bytes"] / 1024, 1) for s in spans],
+    })
 
 # ===================================================================
 # ==========  SETUP + PAGE START  ===================================
 # ===================================================================
 st.set_page_config(layout="wide")
+
+# The overlay checkbox is drawn at the bottom of the sidebar; its value from the
+# previous interaction decides whether this run is traced.
+if st.session_state.get("perf_overlay"):
+    start_trace()
+else:
+    stop_trace()
 st.title("Macroeconomic Indicators Dashboard (No DB, Just CSV & APIs)")
 
 check_auto_refresh()  # Possibly auto-refresh if daily limit/time threshold is met
@@ -191,14 +460,25 @@ if st.sidebar.button("Refresh All Data"):
     st.session_state['last_fetch_time'] = datetime.datetime.now()
     st.session_state['fetch_count_today'] += 1
     st.success("All data refreshed! (Ephemeral in this session)")
+def on_live_intraday_change():
+    if not st.session_state["live_intraday"]:
+        get_intraday_feed.clear()
+
+live_intraday = st.sidebar.checkbox("📡 Live intraday feed (replay)", value=False, key="live_intraday",
+                                    on_change=on_live_intraday_change,
+                                    help="Stream a replayed intraday tick tape into the live monitor panel")
 
 # ===================================================================
 # LOAD EVERYTHING FROM CSV, NOT DB
 # ===================================================================
-cpi, gdp, unrate, cli = load_fred_csv()
-assets = load_yahoo_csv()
-wb_df = load_worldbank_csv()
-pearson_corr, spearman_corr = load_correlation_matrices()
+with span("snapshot.lookup"):
+    snapshot = get_snapshot(data_version())
+
+if snapshot is not None:
+    kpis = snapshot["kpis"]
+else:
+    with span("kpi.values"):
+        kpis = kpi_values(get_series_store())
 
 # ===================================================================
 # ========== SECTION: Key Performance Indicators ====================
@@ -213,10 +493,10 @@ and forward-looking indices.
 """, unsafe_allow_html=True)
 
 col1, col2, col3, col4 = st.columns(4)
-col1.metric("CPI (Level)", f"{cpi['value'].iloc[-1]:,.2f}")
-col2.metric("GDP", f"{gdp['value'].iloc[-1]:,.2f}")
-col3.metric("Unemployment Rate", f"{unrate['value'].iloc[-1]:.2f}%")
-col4.metric("Leading Index (CLI)", f"{cli['value'].iloc[-1]:,.2f}")
+col1.metric("CPI (Level)", f"{kpis['CPI']:,.2f}")
+col2.metric("GDP", f"{kpis['GDP']:,.2f}")
+col3.metric("Unemployment Rate", f"{kpis['Unemployment']:.2f}%")
+col4.metric("Leading Index (CLI)", f"{kpis['CLI']:,.2f}")
 st.divider()
 
 st.markdown("""
@@ -242,23 +522,16 @@ These charts help users spot turning points, inflationary pressures, growth rebo
 </div>
 """, unsafe_allow_html=True)
 
-indicator = st.selectbox("Select a FRED indicator:", ["CPI", "GDP", "Unemployment", "CLI"])
+indicator = st.selectbox("Select a FRED indicator:", list(FRED_SERIES))
 
-def get_chart_data(indicator):
-    if indicator == "CPI":
-        return cpi.copy(), "Consumer Price Index", "Index Level"
-    elif indicator == "GDP":
-        return gdp.copy(), "Gross Domestic Product", "Billions of Dollars"
-    elif indicator == "Unemployment":
-        return unrate.copy(), "Unemployment Rate", "Percent"
-    else:
-        return cli.copy(), "Leading Index", "Index Level"
-
-df, label, unit = get_chart_data(indicator)
+if snapshot is not None:
+    series_start, series_end = (pd.Timestamp(d) for d in snapshot["fred_bounds"][indicator])
+else:
+    series_start, series_end = get_series_store().bounds(FRED_SERIES[indicator][0])
 
 st.sidebar.header("⚙️ Filter & Forecast (FRED)")
-start_date = st.sidebar.date_input("Start Date", df['date'].min().date())
-end_date = st.sidebar.date_input("End Date", df['date'].max().date())
+start_date = st.sidebar.date_input("Start Date", series_start.date())
+end_date = st.sidebar.date_input("End Date", series_end.date())
 smooth = st.sidebar.checkbox("Apply smoothing (7-day rolling)", value=False)
 forecast_toggle = st.sidebar.checkbox("Include FRED forecast (12 months)", value=False)
 
@@ -266,25 +539,36 @@ if st.sidebar.button("🔄 Refresh FRED Data"):
     st.info("Fetching updated FRED data from scripts/data_pipeline/fetch_fred_data.py ...")
     # e.g. subprocess.run(["python","scripts/data_pipeline/fetch_fred_data.py"])
     st.cache_data.clear()
+    st.cache_resource.clear()
+    export_snapshot(get_series_store())
     st.session_state['last_fetch_time'] = datetime.datetime.now()
     st.session_state['fetch_count_today'] += 1
     st.success("FRED data updated!")
 
-df = df[(df['date'] >= pd.to_datetime(start_date)) & (df['date'] <= pd.to_datetime(end_date))]
-if smooth:
-    df['value'] = df['value'].rolling(window=7).mean()
-if forecast_toggle:
-    df = forecast_linear(df)
-
-chart_fred = alt.Chart(df).mark_line().encode(
-    x="date:T",
-    y=alt.Y("value:Q", title=unit),
-    tooltip=["date:T","value:Q"]
-).properties(width=800, height=350, title=f"{label} Over Time").interactive()
+def is_default_view(indicator, start_date, end_date, smooth, forecast_toggle):
+    """
+    True while the FRED inputs are as a first visit sees them: the first
+    indicator over its full date range, unsmoothed, without forecast.
+    """
+    first, last = series_start.date(), series_end.date()
+    return (indicator == next(iter(FRED_SERIES)) and (start_date, end_date) == (first, last)
+            and not smooth and not forecast_toggle)
 
-st.altair_chart(chart_fred, use_container_width=True)
+@st.fragment
+@timed_section("section.fred_trend")
+def render_fred_trend(indicator, start_date, end_date, smooth, forecast_toggle):
+    """
+    No widgets of its own: redraws when the indicator or sidebar inputs change.
+    """
+    label = FRED_SERIES[indicator][1]
+    prerendered = snapshot_panel("fred_trend", is_default_view(indicator, start_date, end_date, smooth, forecast_toggle))
+    if prerendered:
+        render_spec("fred_trend", prerendered["spec"], use_container_width=True)
+    else:
+        df, label, unit = get_indicator_frame(indicator, start_date, end_date, smooth, forecast_toggle)
+        render_chart("fred_trend", fred_trend_chart(df, label, unit), use_container_width=True)
 
-st.markdown(f"""
+    st.markdown(f"""
 <div style="font-size:16px;">
 <p>
 By examining <strong>{label}</strong> over time, you can see how macro shifts unfold. 
@@ -301,40 +585,44 @@ these patterns align with the “state-dependent” insights from the academic r
 </div>
 """, unsafe_allow_html=True)
 
+render_fred_trend(indicator, start_date, end_date, smooth, forecast_toggle)
+
 st.divider()
 
 # ===================================================================
 # ==========  Yahoo Finance Asset Correlation =======================
 # ===================================================================
-st.header("💹 Yahoo Finance Asset Correlation")
-st.markdown("""
+@st.fragment
+@timed_section("section.asset_overlay")
+def render_asset_overlay(indicator, start_date, end_date, smooth, forecast_toggle):
+    """
+    Changing the asset reruns only this section; the indicator inputs come from above.
+    """
+    st.header("💹 Yahoo Finance Asset Correlation")
+    st.markdown("""
 <div style="font-size:25px; line-height:1.6;">
 This section evaluates how selected financial assets (e.g., equities, gold, oil) have historically correlated 
 with macroeconomic indicators. The analysis aids investment decisions and policy modeling.
 </div>
 """, unsafe_allow_html=True)
 
-asset_option = st.selectbox("Compare with an asset:", assets.columns.drop("date"))
-df_merged = pd.merge(df, assets, on="date", how="inner")
-correlation = df_merged["value"].corr(df_merged[asset_option])
-st.write(f"📌 Correlation with **{asset_option.upper()}**: **{correlation:.2f}**")
-
-overlay = df_merged.melt(
-    id_vars="date",
-    value_vars=["value", asset_option],
-    var_name="Series",
-    value_name="Level"
-)
-chart_asset = alt.Chart(overlay).mark_line().encode(
-    x="date:T",
-    y="Level:Q",
-    color="Series:N",
-    tooltip=["date:T","Series:N","Level:Q"]
-).properties(width=800, height=300, title=f"{label} vs {asset_option.upper()}")
+    label = FRED_SERIES[indicator][1]
+    assets = snapshot["options"]["assets"] if snapshot else load_yahoo_csv().columns.drop("date")
+    asset_option = st.selectbox("Compare with an asset:", assets)
+    prerendered = snapshot_panel("asset_overlay", asset_option == assets[0]
+                                 and is_default_view(indicator, start_date, end_date, smooth, forecast_toggle))
+    if prerendered:
+        correlation = prerendered["correlation"]
+    else:
+        correlation, overlay = get_asset_overlay(indicator, start_date, end_date, smooth, forecast_toggle, asset_option)
+    st.write(f"📌 Correlation with **{asset_option.upper()}**: **{correlation:.2f}**")
 
-st.altair_chart(chart_asset, use_container_width=True)
+    if prerendered:
+        render_spec("asset_overlay", prerendered["spec"], use_container_width=True)
+    else:
+        render_chart("asset_overlay", asset_overlay_chart(overlay, label, asset_option), use_container_width=True)
 
-st.markdown("""
+    st.markdown("""
 <div style="font-size:16px;">
 <p>
 These comparative charts echo insights from <em>Macrosynergy (2024)</em>, who show that 
@@ -352,32 +640,381 @@ can signal a hedging effect (e.g., high unemployment vs. equity returns).
 </div>
 """, unsafe_allow_html=True)
 
+render_asset_overlay(indicator, start_date, end_date, smooth, forecast_toggle)
+
+st.divider()
+
+# ===================================================================
+# ==========  Live Intraday Monitor =================================
+# ===================================================================
+def render_intraday(feed):
+    """
+    Redrawn from the engine's in-memory snapshot on every timer tick; only this
+    fragment reruns, and no history is reloaded.
+    """
+    st.header("📡 Live Intraday Monitor (replay)")
+    st.markdown("""
+<div style="font-size:25px; line-height:1.6;">
+Streaming prices for the tracked assets, with rolling returns and correlations updated bar by bar 
+as ticks arrive.
+</div>
+""", unsafe_allow_html=True)
+
+    if feed is None:
+        st.info("Turn on **📡 Live intraday feed** in the sidebar to start the replayed tick stream.")
+        return
+    if feed.error is not None:
+        st.error(f"Intraday feed stopped: {feed.error}")
+
+    with span("data.intraday_snapshot"):
+        snap = feed.engine.snapshot(bars=240)
+    if snap["last_bar"] is None:
+        st.write("⏳ Waiting for the first ticks...")
+        return
+
+    cols = st.columns(len(snap["last_price"]))
+    for col, (symbol, price) in zip(cols, snap["last_price"].items()):
+        change = snap["rolling_return"][symbol]
+        col.metric(symbol.upper(), f"{price:,.2f}", f"{change:+.2%}")
+    st.caption(f"{snap['ticks']:,} ticks · last bar {pd.Timestamp(snap['last_bar']):%H:%M:%S} · "
+               f"rolling window {snap['window_bars']} bars")
+
+    bars = snap["bars"].dropna(how="all")
+    if len(bars) > 1:
+        rebased = bars / bars.bfill().iloc[0] * 100.0
+        live_long = rebased.reset_index().melt("timestamp", var_name="Asset", value_name="Level")
+        chart_live = alt.Chart(live_long).mark_line().encode(
+            x=alt.X("timestamp:T", title="Time"),
+            y=alt.Y("Level:Q", title="Rebased (first bar = 100)", scale=alt.Scale(zero=False)),
+            color="Asset:N",
+            tooltip=["timestamp:T", "Asset:N", alt.Tooltip("Level:Q", format=".3f")]
+        ).properties(height=300)
+
+        corr_long = snap["correlation"].rename_axis("Asset 1").reset_index().melt(
+            "Asset 1", var_name="Asset 2", value_name="Correlation")
+        chart_live_corr = alt.Chart(corr_long).mark_rect().encode(
+            x="Asset 1:N",
+            y="Asset 2:N",
+            color=alt.Color("Correlation:Q", scale=alt.Scale(scheme="redblue", domain=[-1, 1])),
+            tooltip=["Asset 1:N", "Asset 2:N", alt.Tooltip("Correlation:Q", format=".2f")]
+        ).properties(height=300)
+
+        left, right = st.columns([3, 2])
+        with left:
+            render_chart("intraday_prices", chart_live, use_container_width=True)
+        with right:
+            render_chart("intraday_correlation", chart_live_corr, use_container_width=True)
+
+    st.markdown("""
+<div style="font-size:16px;">
+<p>
+Correlations are computed over the most recent bars of log returns and are far noisier than the monthly 
+figures below; short-horizon co-movement mostly reflects common market-wide shocks rather than 
+macroeconomic linkages.
+</p>
+</div>
+""", unsafe_allow_html=True)
+
+intraday_feed = get_intraday_feed() if live_intraday else None
+st.fragment(run_every=LIVE_REFRESH_SECONDS if intraday_feed else None)(
+    timed_section("section.intraday")(render_intraday)
+)(intraday_feed)
+
+st.divider()
+
+# ===================================================================
+# ==========  Historical Scenario Simulations =======================
+# ===================================================================
+@st.fragment
+@timed_section("section.scenarios")
+def render_scenarios():
+    """
+    Episode selection reruns only this section.
+    """
+    st.header("🗺️ Historical Scenario Simulations")
+    st.markdown("""
+<div style="font-size:25px; line-height:1.6;">
+Replay major market episodes (the 2008 crisis, the COVID-19 crash, rate-hike cycles) and see how each asset 
+fared: peak-to-trough drawdown, return over the window, and how long it took to win back the prior peak.
+</div>
+""", unsafe_allow_html=True)
+
+    asset_universe = tuple(load_yahoo_csv().columns.drop("date"))
+    selected_episodes = st.multiselect("Select episodes:", list(EPISODES), default=list(EPISODES))
+
+    if selected_episodes:
+        scenario_stats, scenario_macro = get_scenario_results(tuple(selected_episodes), asset_universe)
+        covered = scenario_stats.dropna(subset=["max_drawdown"])
+        missing = sorted(set(selected_episodes) - set(covered["episode"]))
+        if missing:
+            st.caption(f"No price history available for: {', '.join(missing)}")
+
+        chart_scenarios = alt.Chart(covered).mark_bar().encode(
+            x=alt.X("asset:N", title=None),
+            y=alt.Y("max_drawdown:Q", title="Max Drawdown", axis=alt.Axis(format="%")),
+            color="asset:N",
+            column=alt.Column("episode:N", title=None),
+            tooltip=["episode:N", "asset:N",
+                     alt.Tooltip("max_drawdown:Q", format=".1%"),
+                     alt.Tooltip("cumulative_return:Q", format=".1%"),
+                     "trough_date:T", "recovery_days:Q"]
+        ).properties(width=140, height=300)
+
+        render_chart("scenarios", chart_scenarios)
+
+        st.dataframe(
+            covered.drop(columns="yield_change_bp").style.format({
+                "cumulative_return": "{:.1%}", "max_drawdown": "{:.1%}", "recovery_days": "{:,.0f}"
+            }, na_rep="not yet"),
+            use_container_width=True
+        )
+        # Yields aren't prices: they show up here as a change in bp, next to the macro moves
+        yield_moves = (scenario_stats.dropna(subset=["yield_change_bp"])
+                       .pivot(index="episode", columns="asset", values="yield_change_bp")
+                       .rename(columns=lambda c: f"{c} Δ (bp)"))
+        st.markdown("**Macro indicator and yield change over each episode** (blank: no new release in the window)")
+        st.dataframe(
+            scenario_macro.pivot(index="episode", columns="indicator", values="change")
+                          .join(yield_moves)
+                          .reindex(selected_episodes),
+            use_container_width=True
+        )
+    else:
+        st.info("Select at least one episode to run the scenarios.")
+
+    st.markdown("""
+<div style="font-size:16px;">
+<p>
+Episodes make the <em>state-dependence</em> described by <em>Di Bonaventura & Morini (2024)</em> concrete: 
+the 2022 rate-hike cycle started from already-elevated inflation, and the 10-year yield jumped by more than 200bp 
+(so bond prices fell) while equities sold off, whereas in the COVID-19 crash the yield dropped sharply and 
+Treasuries cushioned the equity drawdown. 
+Recovery times show how long those shocks took to work through prices.
+</p>
+</div>
+""", unsafe_allow_html=True)
+
+render_scenarios()
+
+st.divider()
+
+# ===================================================================
+# ==========  Macro-Shock Portfolio Simulator =======================
+# ===================================================================
+@st.fragment
+@timed_section("section.shock_simulator")
+def render_shock_simulator():
+    """
+    Shock, portfolio and path controls rerun only this section.
+    """
+    st.header("🎲 Macro-Shock Portfolio Simulator")
+    st.markdown("""
+<div style="font-size:25px; line-height:1.6;">
+Shock the macro factors (inflation, ΔCLI, unemployment, 10Y rates) and simulate thousands of 
+portfolio paths through a factor model fitted on monthly FRED and Yahoo data.
+</div>
+""", unsafe_allow_html=True)
+
+    factor_model = get_factor_model()
+    shock_cols = st.columns(len(FACTORS))
+    shock_labels = {
+        "inflation": "Inflation shock (pp)",
+        "cli": "ΔCLI shock",
+        "unemployment": "Unemployment shock (pp)",
+        "rates": "10Y rates shock (pp)",
+    }
+    shock = tuple(
+        (name, col.slider(shock_labels[name], -3.0, 3.0, 0.0, 0.25))
+        for name, col in zip(FACTORS, shock_cols)
+    )
+    mc_assets = st.multiselect("Portfolio assets (equal-weighted):", factor_model.assets,
+                               default=factor_model.assets)
+    mc_col1, mc_col2 = st.columns(2)
+    mc_horizon = mc_col1.slider("Horizon (months)", 1, 36, 12)
+    mc_paths = mc_col2.select_slider("Simulated paths", [10_000, 25_000, 50_000, 100_000], value=50_000)
+
+    if mc_assets:
+        shocked, baseline, hist = get_shock_simulation(
+            tuple((k, v) for k, v in shock if v != 0.0), tuple(mc_assets), mc_paths, mc_horizon
+        )
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Mean return", f"{shocked['mean']:.1%}", f"{shocked['mean'] - baseline['mean']:+.1%} vs baseline")
+        m2.metric("5% VaR", f"{shocked['VaR']:.1%}", f"{shocked['VaR'] - baseline['VaR']:+.1%}", delta_color="inverse")
+        m3.metric("5% CVaR", f"{shocked['CVaR']:.1%}", f"{shocked['CVaR'] - baseline['CVaR']:+.1%}", delta_color="inverse")
+        m4.metric("Probability of loss", f"{shocked['prob_loss']:.0%}")
+
+        chart_mc = alt.Chart(hist).mark_area(opacity=0.5, interpolate="step").encode(
+            x=alt.X("return:Q", title=f"Portfolio return over {mc_horizon} months", axis=alt.Axis(format="%")),
+            y=alt.Y("count:Q", title="Paths", stack=None),
+            color="Scenario:N",
+            tooltip=[alt.Tooltip("return:Q", format=".1%"), "count:Q", "Scenario:N"]
+        ).properties(width=800, height=300, title="Simulated Return Distribution")
+
+        render_chart("shock_simulator", chart_mc, use_container_width=True)
+        st.caption(f"Factor model fitted on {factor_model.nobs} months; "
+                   f"asset R² ranges {factor_model.r_squared.min():.2f}–{factor_model.r_squared.max():.2f}.")
+    else:
+        st.info("Select at least one asset for the portfolio.")
+
+    st.markdown("""
+<div style="font-size:16px;">
+<p>
+The factor model is linear and unconditional, so it captures average sensitivities rather than the 
+<em>state-dependent</em> responses stressed by <em>Di Bonaventura & Morini (2024)</em>. Treat the shocked 
+distribution as a first-order estimate: a +1pp inflation surprise from a 2% base and from a 6% base 
+produce the same simulated response here, even though history suggests they differ.
+</p>
+</div>
+""", unsafe_allow_html=True)
+
+render_shock_simulator()
+
+st.divider()
+
+# ===================================================================
+# ==========  Regime-Conditional Correlations =======================
+# ===================================================================
+@st.fragment
+@timed_section("section.regimes")
+def render_regimes():
+    """
+    Slices the precomputed regime cube; reruns only this section.
+    """
+    st.header("🧭 Regime-Conditional Correlations")
+    st.markdown("""
+<div style="font-size:25px; line-height:1.6;">
+Split history by each indicator's <em>state</em>: its level (low / mid / high tercile) and whether it is 
+rising or falling. Then see how asset returns co-move with the indicator within each state.
+</div>
+""", unsafe_allow_html=True)
+
+    regime_cube = get_regime_cube()
+    indicator_names = {"CPIAUCNS": "CPI Inflation (YoY)", "GDP": "GDP Growth (YoY)",
+                       "UNRATE": "Unemployment Rate", "USSLIND": "Leading Index (CLI)"}
+    rc_col1, rc_col2 = st.columns(2)
+    regime_indicator = rc_col1.selectbox("Conditioning indicator:", regime_cube.indicators,
+                                         format_func=lambda k: indicator_names.get(k, k))
+    regime_stat = rc_col2.radio("Statistic:", ["Correlation", "Mean monthly return"], horizontal=True)
+
+    cell_values = regime_cube.slice(regime_indicator, "corr" if regime_stat == "Correlation" else "mean_return")
+    cell_counts = pd.Series(regime_cube.count[regime_cube.indicators.index(regime_indicator)],
+                            index=regime_cube.regimes, name="Months")
+    regime_long = cell_values.rename_axis("Regime").reset_index().melt(
+        id_vars="Regime", var_name="Asset", value_name="Value"
+    ).merge(cell_counts.rename_axis("Regime").reset_index(), on="Regime")
+
+    chart_regime = alt.Chart(regime_long).mark_rect().encode(
+        x="Asset:N",
+        y=alt.Y("Regime:N", sort=regime_cube.regimes),
+        color=alt.Color("Value:Q", scale=alt.Scale(scheme="redblue", domainMid=0), title=regime_stat),
+        tooltip=["Regime:N", "Asset:N", alt.Tooltip("Value:Q", format=".3f"), "Months:Q"]
+    ).properties(width=600, height=300,
+                 title=f"{regime_stat} by {indicator_names.get(regime_indicator, regime_indicator)} regime")
+
+    render_chart("regimes", chart_regime, use_container_width=True)
+
+    current_regime, as_of = regime_cube.current_regime(regime_indicator)
+    if current_regime:
+        st.write(f"📌 Current regime: **{current_regime}** (as of {as_of:%b %Y})")
+
+    st.markdown("""
+<div style="font-size:16px;">
+<p>
+This is the conditional view argued for by <em>Di Bonaventura & Morini (2024)</em>: the same indicator move can 
+carry opposite signs for an asset depending on whether the indicator starts from a low or a high level, and 
+whether it has been rising or falling. Cells with fewer than six months of history are left blank.
+</p>
+</div>
+""", unsafe_allow_html=True)
+
+render_regimes()
+
+st.divider()
+
+# ===================================================================
+# ==========  Lead-Lag Predictive Regressions =======================
+# ===================================================================
+@st.fragment
+@timed_section("section.lead_lag")
+def render_lead_lag():
+    """
+    Predictor selection reruns only this section.
+    """
+    st.header("🔮 Lead-Lag Predictive Regressions")
+    st.markdown("""
+<div style="font-size:25px; line-height:1.6;">
+Do last month's macro changes predict asset returns over the next 1–12 months? Each cell is a predictive 
+regression of forward returns on the lagged indicator change, with Newey-West t-statistics.
+</div>
+""", unsafe_allow_html=True)
+
+    lead_lag = load_lead_lag_table()
+    ll_names = {"USSLIND": "ΔCLI (Leading Index)", "CPIAUCNS": "Δ CPI Inflation (YoY)",
+                "GDP": "Δ GDP Growth (YoY)", "UNRATE": "Δ Unemployment Rate"}
+    ll_indicators = sorted(lead_lag["indicator"].unique(), key=lambda k: k != "USSLIND")
+    ll_indicator = st.selectbox("Predictor:", ll_indicators, format_func=lambda k: ll_names.get(k, k))
+    ll_view = lead_lag[lead_lag["indicator"] == ll_indicator]
+
+    chart_ll = alt.Chart(ll_view).mark_rect().encode(
+        x=alt.X("horizon:O", title="Horizon (months)"),
+        y=alt.Y("asset:N", title=None),
+        color=alt.Color("t_stat:Q", scale=alt.Scale(scheme="redblue", domain=[-4, 4]), title="NW t-stat"),
+        tooltip=["asset:N", "horizon:O",
+                 alt.Tooltip("beta:Q", format=".4f"), alt.Tooltip("t_stat:Q", format=".2f"),
+                 alt.Tooltip("r2:Q", format=".3f"), alt.Tooltip("oos_r2:Q", format=".3f"), "nobs:Q"]
+    ).properties(width=800, height=250, title=f"{ll_names.get(ll_indicator, ll_indicator)} → Forward Returns")
+
+    render_chart("lead_lag", chart_ll, use_container_width=True)
+
+    significant = ll_view[ll_view["t_stat"].abs() >= 1.96]
+    st.write(f"📌 {len(significant)} of {len(ll_view)} asset × horizon cells are significant at the 5% level; "
+             f"{(ll_view['oos_r2'] > 0).sum()} beat the historical mean out of sample.")
+
+    st.markdown("""
+<div style="font-size:16px;">
+<p>
+<em>Long et al. (2022)</em> find that changes in leading indicators predict stock returns because investors 
+underreact to macro news. In-sample t-statistics can overstate that, so the out-of-sample R² 
+(expanding-window forecasts versus the historical mean) is the stricter test: positive values mean the 
+macro signal added forecasting power in real time.
+</p>
+</div>
+""", unsafe_allow_html=True)
+
+render_lead_lag()
+
 st.divider()
 
 # ===================================================================
 # ==========  World Bank Macroeconomic Indicators ====================
 # ===================================================================
-st.header("🌍 World Bank Macroeconomic Indicators")
-st.markdown("""
+@st.fragment
+@timed_section("section.worldbank")
+def render_worldbank():
+    """
+    Metric selection reruns only this section.
+    """
+    st.header("🌍 World Bank Macroeconomic Indicators")
+    st.markdown("""
 <div style="font-size:25px; line-height:1.6;">
 This panel provides long-term macroeconomic statistics from the World Bank — offering global perspectives 
 on development, population, and fiscal behavior.
 </div>
 """, unsafe_allow_html=True)
 
-wb_metric = st.selectbox("Select a World Bank metric:", wb_df.columns.drop("date"))
-latest_val = wb_df[wb_metric].dropna().iloc[-1]
-st.metric(f"Latest {wb_metric.replace('_',' ').title()}", f"{latest_val:,.2f}")
-
-chart_wb = alt.Chart(wb_df).mark_line().encode(
-    x="date:T",
-    y=alt.Y(wb_metric, title=wb_metric.replace("_"," ").title()),
-    tooltip=["date:T", wb_metric]
-).properties(width=800, height=350, title=f"{wb_metric.replace('_',' ').title()} Over Time")
-
-st.altair_chart(chart_wb, use_container_width=True)
+    metrics = snapshot["options"]["worldbank_metrics"] if snapshot else load_worldbank_csv().columns.drop("date")
+    wb_metric = st.selectbox("Select a World Bank metric:", metrics)
+    prerendered = snapshot_panel("worldbank", wb_metric == metrics[0])
+    if prerendered:
+        st.metric(f"Latest {wb_metric.replace('_',' ').title()}", f"{prerendered['latest']:,.2f}")
+        render_spec("worldbank", prerendered["spec"], use_container_width=True)
+    else:
+        wb_df = load_worldbank_csv()
+        latest_val = wb_df[wb_metric].dropna().iloc[-1]
+        st.metric(f"Latest {wb_metric.replace('_',' ').title()}", f"{latest_val:,.2f}")
+        render_chart("worldbank", worldbank_chart(wb_df, wb_metric), use_container_width=True)
 
-st.markdown("""
+    st.markdown("""
 <div style="font-size:16px;">
 <p>
 Viewing <strong>global data</strong> helps place U.S. macro trends in context. 
@@ -393,39 +1030,72 @@ Correlation Matrix to see if domestic trends mirror global shifts.
 </div>
 """, unsafe_allow_html=True)
 
+render_worldbank()
+
 st.divider()
 
 # ===================================================================
 # ==========  Correlation Matrix Explorer ============================
 # ===================================================================
-st.header("🧠 Correlation Matrix Explorer")
-st.markdown("""
+@st.fragment
+@timed_section("section.correlation_explorer")
+def render_correlation_explorer():
+    """
+    View, correlation type and variable selection rerun only this section.
+    """
+    st.header("🧠 Correlation Matrix Explorer")
+    st.markdown("""
 <div style="font-size:25px; line-height:1.6;">
 This matrix provides a bird’s-eye view of how all macro indicators and asset classes interact. 
 Patterns here can validate existing hypotheses or reveal new research questions.
 </div>
 """, unsafe_allow_html=True)
 
-corr_type = st.radio("Correlation type:", ["Pearson","Spearman"], horizontal=True)
-corr_matrix = pearson_corr if corr_type=="Pearson" else spearman_corr
-
-selected_vars = st.multiselect("Select variables to compare:", corr_matrix.columns.tolist(),
-                               default=corr_matrix.columns.tolist())
-if selected_vars:
-    filtered = corr_matrix.loc[selected_vars, selected_vars].reset_index().melt(id_vars="index")
-    filtered.columns = ["Variable 1","Variable 2","Correlation"]
-    mat_chart = alt.Chart(filtered).mark_rect().encode(
-        x="Variable 1:O",
-        y="Variable 2:O",
-        color=alt.Color("Correlation:Q", scale=alt.Scale(scheme="redblue")),
-        tooltip=["Variable 1","Variable 2","Correlation"]
-    ).properties(width=600, height=600, title=f"{corr_type} Correlation Matrix")
-
-    st.altair_chart(mat_chart, use_container_width=True)
-else:
-    st.info("Select at least one variable to display the matrix.")
+    explorer_view = st.radio("View:", ["Correlation matrix", "Factor space"], horizontal=True)
 
-st.markdown("""
+    if explorer_view == "Correlation matrix":
+        corr_type = st.radio("Correlation type:", ["Pearson","Spearman"], horizontal=True)
+        variables = (snapshot and snapshot["options"]["correlation_variables"]
+                     or load_correlation_matrices()[0].columns.tolist())
+
+        selected_vars = st.multiselect("Select variables to compare:", variables, default=variables)
+        prerendered = snapshot_panel("correlation_matrix", corr_type == "Pearson" and selected_vars == variables)
+        if prerendered:
+            render_spec("correlation_matrix", prerendered["spec"], use_container_width=True)
+        elif selected_vars:
+            filtered = get_correlation_long(corr_type, tuple(selected_vars))
+            render_chart("correlation_matrix", correlation_chart(filtered, corr_type), use_container_width=True)
+        else:
+            st.info("Select at least one variable to display the matrix.")
+    else:
+        factor_loadings, factor_variance = load_factor_outputs()
+        components = factor_loadings.columns.tolist()
+        fx_col1, fx_col2 = st.columns(2)
+        x_pc = fx_col1.selectbox("X axis factor:", components, index=0)
+        y_pc = fx_col2.selectbox("Y axis factor:", components, index=min(1, len(components) - 1))
+
+        # One point per asset, so the chart stays small however large the universe gets
+        points = factor_loadings[[x_pc, y_pc]].rename_axis("Asset").reset_index()
+        base = alt.Chart(points).encode(
+            x=alt.X(f"{x_pc}:Q", title=f"{x_pc} loading ({factor_variance.loc[x_pc, 'explained_variance_ratio']:.0%} of variance)"),
+            y=alt.Y(f"{y_pc}:Q", title=f"{y_pc} loading ({factor_variance.loc[y_pc, 'explained_variance_ratio']:.0%} of variance)"),
+            tooltip=["Asset:N", alt.Tooltip(f"{x_pc}:Q", format=".2f"), alt.Tooltip(f"{y_pc}:Q", format=".2f")]
+        )
+        factor_chart = (base.mark_circle(size=80) + base.mark_text(align="left", dx=7).encode(text="Asset:N")
+                        ).properties(width=600, height=500, title="Assets in Factor Space").interactive()
+
+        variance_chart = alt.Chart(factor_variance.reset_index()).mark_bar().encode(
+            x=alt.X("component:N", title=None),
+            y=alt.Y("explained_variance_ratio:Q", title="Share of return variance", axis=alt.Axis(format="%")),
+            tooltip=["component:N", alt.Tooltip("explained_variance_ratio:Q", format=".1%"),
+                     alt.Tooltip("cumulative:Q", format=".1%")]
+        ).properties(width=250, height=500, title="Explained Variance")
+
+        render_chart("factor_space", factor_chart | variance_chart)
+        st.caption("Loadings from an incremental PCA of standardized daily Yahoo returns "
+                   "(scripts/analysis/factors.py). Assets close together move together.")
+
+    st.markdown("""
 <div style="font-size:16px;">
 <p>
 Correlation alone can't capture <em>how</em> or <em>why</em> macro variables drive performance, but it hints at possible relationships. 
@@ -439,6 +1109,8 @@ even if the correlation at face value looks the same.
 </div>
 """, unsafe_allow_html=True)
 
+render_correlation_explorer()
+
 # ===================================================================
 # ==========  FINAL SUMMARY  ========================================
 # ===================================================================
@@ -508,3 +1180,22 @@ Available at: [https://macrosynergy.com/research/...](https://macrosynergy.com/r
 *How Do Macro-Financial Factors Influence Asset Classes' Performance? An Empirical Analysis.*  
 Preprint (Version 1) available at [https://doi.org/10.21203/rs.3.rs-5431562/v1](https://doi.org/10.21203/rs.3.rs-5431562/v1)
 """)
+
+# ===================================================================
+# ==========  PERFORMANCE OVERLAY  ==================================
+# ===================================================================
+st.sidebar.markdown("### Diagnostics")
+st.sidebar.checkbox("⏱️ Performance overlay", key="perf_overlay",
+                    help="Time each section, loader and chart (wall ms, rows, payload KB) on the next run.")
+if st.session_state.get("perf_overlay"):
+    spans = stop_trace()
+    fragment_spans = st.session_state.get("perf_fragment_spans", [])
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        top_level = sum(s["wall_ms"] for s in spans if s["depth"] == 0)
+        st.caption(f"Last full run: {len(spans)} spans, {top_level:,.1f} ms in traced blocks.")
+        st.dataframe(spans_frame(spans), hide_index=True, use_container_width=True)
+        if fragment_spans:
+            st.caption("Last section-only rerun:")
+            st.dataframe(spans_frame(fragment_spans), hide_index=True, use_container_width=True)
+        st.download_button("Download trace (JSONL)", to_jsonl(spans + fragment_spans),
+                           file_name="dashboard_trace.jsonl", mime="application/x-ndjson")
@@ -1,35 +1,54 @@
 # scripts/analysis/correlation_matrix.py
 
+import argparse
 import pandas as pd
-from sqlalchemy import create_engine
-from scripts.db.db_connect import engine  # Use your existing DB connection
+from scripts.db.db_connect import STORAGE_BACKEND
+from scripts.utils_tracing import span
+
+def load_and_prepare_data(backend=None):
+    backend = backend or STORAGE_BACKEND
+    if backend == "duckdb":
+        # Same panel, computed in-process by DuckDB straight from the CSV/Parquet files
+        from scripts.db.duckdb_backend import load_correlation_input
+        return load_correlation_input()
+    if backend != "postgres":
+        raise ValueError(f"Unknown storage backend: {backend}")
+    from scripts.db.db_connect import engine  # Use your existing DB connection (needs the Postgres driver)
 
-def load_and_prepare_data():
     # 1. Load data
-    yahoo_df = pd.read_sql("SELECT * FROM yahoo_assets", engine, parse_dates=["date"])
-    fred_df = pd.read_sql("SELECT * FROM fred_indicators", engine, parse_dates=["date"])
-    wb_df = pd.read_sql("SELECT * FROM macro_indicators", engine, parse_dates=["date"])
+    with span("corr.load_sql") as sp:
+        yahoo_df = pd.read_sql("SELECT * FROM yahoo_assets", engine, parse_dates=["date"])
+        fred_df = pd.read_sql("SELECT * FROM fred_indicators", engine, parse_dates=["date"])
+        wb_df = pd.read_sql("SELECT * FROM macro_indicators", engine, parse_dates=["date"])
+        sp.set(rows=len(yahoo_df) + len(fred_df) + len(wb_df), payload=[yahoo_df, fred_df, wb_df])
 
-    # 2. Resample to monthly
-    yahoo_pivot = yahoo_df.pivot(index="date", columns="symbol", values="adj_close").resample("M").last()
-    fred_pivot = fred_df.pivot(index="date", columns="indicator", values="value").resample("M").last()
-    wb_resampled = wb_df.set_index("date").resample("M").ffill()
+    with span("corr.resample_merge") as sp:
+        # 2. Resample to monthly
+        yahoo_pivot = yahoo_df.pivot(index="date", columns="symbol", values="adj_close").resample("M").last()
+        fred_pivot = fred_df.pivot(index="date", columns="indicator", values="value").resample("M").last()
+        wb_resampled = wb_df.set_index("date").resample("M").ffill()
 
-    # 3. Merge all into one DataFrame
-    df_combined = pd.concat([yahoo_pivot, fred_pivot, wb_resampled], axis=1)
+        # 3. Merge all into one DataFrame
+        df_combined = pd.concat([yahoo_pivot, fred_pivot, wb_resampled], axis=1)
 
-    # 4. Drop rows with many missing values
-    df_combined = df_combined.dropna(thresh=int(df_combined.shape[1] * 0.6))
+        # 4. Drop rows with many missing values
+        df_combined = df_combined.dropna(thresh=int(df_combined.shape[1] * 0.6))
+        sp.set(rows=len(df_combined), payload=df_combined)
 
     return df_combined
 
 def compute_correlations(df):
-    pearson_corr = df.corr(method="pearson")
-    spearman_corr = df.corr(method="spearman")
+    with span("corr.compute", rows=len(df), payload=df):
+        pearson_corr = df.corr(method="pearson")
+        spearman_corr = df.corr(method="spearman")
     return pearson_corr, spearman_corr
 
 if __name__ == "__main__":
-    df = load_and_prepare_data()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", choices=["postgres", "duckdb"], default=STORAGE_BACKEND)
+    args = parser.parse_args()
+
+    df = load_and_prepare_data(args.backend)
     pearson_corr, spearman_corr = compute_correlations(df)
 
     # Save for inspection
@@ -0,0 +1,175 @@
+# scripts/analysis/factors.py
+"""
+Statistical factor decomposition of the cross-asset daily return panel.
+
+Returns are standardized and fed to sklearn's IncrementalPCA, so new days can be
+folded in with partial_fit instead of refitting on the full history. The
+fitted state is pickled, and loadings, explained variance and factor time
+series are written to data/processed for the dashboard.
+
+Every update moves the basis, so the factor series is rewritten in full on the
+current basis each run (projection is cheap next to the fit) rather than
+appended to, which would splice scores from different bases together.
+
+The basis is tied to the asset set it was fitted on. When the return panel's
+columns no longer match it (an asset added or dropped upstream), the CLI
+refits from scratch instead of updating.
+"""
+
+import argparse
+import os
+import pickle
+import warnings
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import IncrementalPCA
+from sklearn.preprocessing import StandardScaler
+
+OUTPUT_DIR = os.path.join("data", "processed")
+STATE_PATH = os.path.join(OUTPUT_DIR, "factor_model.pkl")
+LOADINGS_PATH = os.path.join(OUTPUT_DIR, "factor_loadings.csv")
+VARIANCE_PATH = os.path.join(OUTPUT_DIR, "factor_explained_variance.csv")
+SERIES_PATH = os.path.join(OUTPUT_DIR, "factor_returns.csv")
+
+N_COMPONENTS = 5
+BATCH_SIZE = 500
+
+
+def daily_returns(prices):
+    """Daily log returns of an aligned price panel."""
+    return np.log(prices).diff().dropna(how="all")
+
+
+def _component_names(n):
+    return [f"PC{i + 1}" for i in range(n)]
+
+
+def fit_factors(returns, n_components=N_COMPONENTS, batch_size=BATCH_SIZE):
+    """
+    Fit the factor model from scratch, in mini-batches.
+
+    The scaler is fitted once here and kept fixed, so later incremental
+    updates stay on the same standardized basis.
+    """
+    returns = returns.dropna()
+    n_components = min(n_components, returns.shape[1])
+    scaler = StandardScaler().fit(returns.to_numpy())
+    ipca = IncrementalPCA(n_components=n_components, batch_size=batch_size)
+    ipca.fit(scaler.transform(returns.to_numpy()))
+
+    # Sign convention: each component's loadings sum to a positive number
+    signs = np.sign(ipca.components_.sum(axis=1))
+    signs[signs == 0] = 1.0
+
+    return {
+        "assets": list(returns.columns),
+        "scaler": scaler,
+        "ipca": ipca,
+        "signs": signs,
+        "last_date": returns.index[-1],
+        "pending": returns.iloc[:0],
+    }
+
+
+def update_factors(state, returns):
+    """
+    Fold returns after state["last_date"] into the model with partial_fit.
+
+    IncrementalPCA needs at least n_components rows per batch, so smaller
+    updates are held in state["pending"] until enough have accumulated.
+    Returns the rows actually applied (possibly empty).
+
+    Only the fitted assets are used; extra columns in returns are ignored with
+    a warning, since picking them up needs a refit (fit_factors).
+    """
+    added = [c for c in returns.columns if c not in state["assets"]]
+    if added:
+        warnings.warn(f"Assets not in the fitted factor model are ignored until a refit: {added}")
+
+    # Rows already stashed in pending are past last_date too; don't take them again
+    seen = state["last_date"] if state["pending"].empty else max(state["last_date"], state["pending"].index[-1])
+    new = returns.loc[returns.index > seen, state["assets"]].dropna()
+    batch = pd.concat([state["pending"], new])
+    if len(batch) < state["ipca"].n_components_:
+        state["pending"] = batch
+        return batch.iloc[:0]
+
+    previous = state["ipca"].components_ * state["signs"][:, None]
+    state["ipca"].partial_fit(state["scaler"].transform(batch.to_numpy()))
+
+    # Keep each component's orientation continuous with the stored history
+    state["signs"] = np.sign((state["ipca"].components_ * previous).sum(axis=1))
+    state["signs"][state["signs"] == 0] = 1.0
+    state["last_date"] = batch.index[-1]
+    state["pending"] = batch.iloc[:0]
+    return batch
+
+
+def loadings(state):
+    """Assets x components loading matrix."""
+    components = state["ipca"].components_ * state["signs"][:, None]
+    return pd.DataFrame(components.T, index=state["assets"], columns=_component_names(len(components)))
+
+
+def explained_variance(state):
+    ipca = state["ipca"]
+    return pd.DataFrame({
+        "explained_variance_ratio": ipca.explained_variance_ratio_,
+        "cumulative": np.cumsum(ipca.explained_variance_ratio_),
+    }, index=pd.Index(_component_names(ipca.n_components_), name="component"))
+
+
+def factor_series(state, returns):
+    """Factor return time series for the given rows."""
+    rows = returns[state["assets"]].dropna()
+    columns = _component_names(state["ipca"].n_components_)
+    if rows.empty:
+        return pd.DataFrame(columns=columns, index=rows.index)
+    scores = state["ipca"].transform(state["scaler"].transform(rows.to_numpy())) * state["signs"]
+    return pd.DataFrame(scores, index=rows.index, columns=columns)
+
+
+def save_state(state, path=STATE_PATH):
+    with open(path, "wb") as f:
+        pickle.dump(state, f)
+
+
+def load_state(path=STATE_PATH):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def save_outputs(state, series):
+    loadings(state).to_csv(LOADINGS_PATH, index_label="asset")
+    explained_variance(state).to_csv(VARIANCE_PATH)
+    series.to_csv(SERIES_PATH, index_label="date", float_format="%.6f")
+
+
+if __name__ == "__main__":
+    from scripts.data_pipeline.load_local_data import load_yahoo_panel
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refit", action="store_true",
+                        help="Ignore saved state and refit from scratch (done automatically when "
+                             "the Yahoo asset set differs from the one the saved model was fitted on)")
+    parser.add_argument("--components", type=int, default=N_COMPONENTS)
+    args = parser.parse_args()
+
+    returns = daily_returns(load_yahoo_panel())
+
+    state = None if args.refit or not os.path.exists(STATE_PATH) else load_state()
+    if state is not None and set(state["assets"]) != set(returns.columns):
+        print(f"⚠️ Asset set changed ({', '.join(state['assets'])} -> {', '.join(returns.columns)}); refitting.")
+        state = None
+
+    if state is None:
+        state = fit_factors(returns, args.components)
+        save_outputs(state, factor_series(state, returns))
+        print(f"✅ Fitted {state['ipca'].n_components_} factors on {len(returns)} days.")
+    else:
+        applied = update_factors(state, returns)
+        save_outputs(state, factor_series(state, returns.loc[:state["last_date"]]))
+        print(f"✅ Updated factors with {len(applied)} new days (last date {state['last_date']:%Y-%m-%d}).")
+
+    save_state(state)
@@ -0,0 +1,31 @@
+# scripts/analysis/forecast.py
+"""
+Linear trend forecast used by the dashboard's FRED trend and asset overlay
+sections.
+"""
+
+import pandas as pd
+
+from scripts.utils_tracing import span
+
+
+def forecast_linear(df, months=12):
+    """
+    Fit value ~ date (as ordinal) and append `months` month-end projections to
+    a date/value frame.
+    """
+    from sklearn.linear_model import LinearRegression
+    with span("data.forecast_linear", rows=len(df)):
+        df = df.dropna().copy()
+        df['timestamp'] = df['date'].map(pd.Timestamp.toordinal)
+
+        X = df['timestamp'].values.reshape(-1, 1)
+        y = df['value'].values
+        model = LinearRegression().fit(X, y)
+
+        future_dates = pd.date_range(start=df['date'].max(), periods=months+1, freq='M')[1:]
+        future_ordinals = future_dates.map(pd.Timestamp.toordinal).values.reshape(-1, 1)
+        future_preds = model.predict(future_ordinals)
+
+        forecast_df = pd.DataFrame({'date': future_dates, 'value': future_preds})
+        return pd.concat([df[['date','value']], forecast_df])
@@ -0,0 +1,179 @@
+# scripts/analysis/lead_lag.py
+"""
+Lead-lag predictive regressions of forward asset returns on lagged macro changes
+(Long et al., 2022: ΔCLI -> equity returns).
+
+For every indicator i, asset a (prices only; yield series are left out, as in
+regimes.py) and horizon h = 1..H:
+
+    log(P[t+h] / P[t]) = alpha + beta * Δx_i[t - lag] + e
+
+All indicator x asset x horizon regressions are stacked into one batched
+least-squares solve. Standard errors are Newey-West (Bartlett kernel, h lags
+to cover the overlap of h-month returns). Out-of-sample fit is measured
+with expanding-window forecasts against the expanding historical mean
+(Campbell-Thompson R²).
+"""
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from scripts.analysis.regimes import indicator_levels
+from scripts.data_pipeline.load_local_data import YIELD_SERIES, to_monthly
+
+OUTPUT_PATH = os.path.join("data", "processed", "lead_lag_regressions.csv")
+
+MAX_HORIZON = 12
+PUBLICATION_LAG = 1   # months between an indicator's reference month and its release
+MIN_TRAIN = 36        # months before the first out-of-sample forecast
+
+
+def build_design(macro, prices, max_horizon=MAX_HORIZON, lag=PUBLICATION_LAG):
+    """
+    Align predictors and targets on a monthly grid.
+
+    Returns (X, Y, indicators, assets, dates) with X: (T, I) lagged indicator
+    changes and Y: (H, T, A) forward log returns, NaN where unavailable.
+    """
+    prices = prices.drop(columns=[c for c in YIELD_SERIES if c in prices.columns])
+    changes = indicator_levels(macro).diff().shift(lag)
+    log_prices = np.log(to_monthly(prices))
+    changes, log_prices = changes.align(log_prices, join="inner", axis=0)
+
+    P = log_prices.to_numpy()
+    T = len(P)
+    Y = np.full((max_horizon, T, P.shape[1]), np.nan)
+    for h in range(1, max_horizon + 1):
+        Y[h - 1, : T - h] = P[h:] - P[:-h]
+
+    return changes.to_numpy(), Y, list(changes.columns), list(log_prices.columns), log_prices.index
+
+
+def _masked_sums(X, Y):
+    """Sufficient statistics per (i, h, a, t) with jointly valid x and y."""
+    W = (~np.isnan(X)).T[:, None, None, :] & (~np.isnan(Y)).transpose(0, 2, 1)[None]   # (I, H, A, T)
+    x = np.nan_to_num(X).T[:, None, None, :]
+    y = np.nan_to_num(Y).transpose(0, 2, 1)[None]
+    W = W.astype(float)
+    return W, x * W, y * W
+
+
+def fit_lead_lag(X, Y):
+    """
+    Batched OLS with Newey-West standard errors.
+
+    Returns a dict of (I, H, A) arrays: alpha, beta, se_beta, t_stat, r2, nobs.
+    Cells that cannot be estimated (no more than two jointly valid rows, or a
+    constant predictor) are NaN instead of failing the whole batch.
+    """
+    W, xw, yw = _masked_sums(X, Y)
+    n = W.sum(-1)
+    sx, sy = xw.sum(-1), yw.sum(-1)
+    sxx, sxy = (xw * xw).sum(-1), (xw * yw).sum(-1)
+
+    XtX = np.stack([np.stack([n, sx], -1), np.stack([sx, sxx], -1)], -2)        # (I, H, A, 2, 2)
+    XtY = np.stack([sy, sxy], -1)[..., None]                                    # (I, H, A, 2, 1)
+
+    # Swap degenerate cells for the identity so the batched solve goes through;
+    # their results are blanked below.
+    det = n * sxx - sx * sx
+    ok = (n > 2) & (det > 1e-12 * np.maximum(n * sxx, 1e-300))
+    XtX = np.where(ok[..., None, None], XtX, np.eye(2))
+    coef = np.linalg.solve(XtX, XtY)[..., 0]
+    alpha, beta = coef[..., 0], coef[..., 1]
+
+    u = (yw - alpha[..., None] * W - beta[..., None] * xw)                       # zero off-sample
+    g = np.stack([u, u * xw], -1)                                                # (I, H, A, T, 2)
+
+    S = np.einsum("ihatk,ihatl->ihakl", g, g)
+    for h in range(Y.shape[0]):
+        bandwidth = h + 1
+        for lag in range(1, bandwidth + 1):
+            weight = 1.0 - lag / (bandwidth + 1.0)
+            gamma = np.einsum("iatk,iatl->iakl", g[:, h, :, lag:], g[:, h, :, :-lag])
+            S[:, h] += weight * (gamma + np.swapaxes(gamma, -1, -2))
+
+    XtX_inv = np.linalg.inv(XtX)
+    V = XtX_inv @ S @ XtX_inv
+    se_beta = np.sqrt(V[..., 1, 1])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ybar = sy / n
+        ssr = (u * u).sum(-1)
+        sst = (yw * yw).sum(-1) - n * ybar * ybar
+        stats = {
+            "alpha": alpha,
+            "beta": beta,
+            "se_beta": se_beta,
+            "t_stat": beta / se_beta,
+            "r2": 1.0 - ssr / sst,
+        }
+    stats = {k: np.where(ok, v, np.nan) for k, v in stats.items()}
+    stats["nobs"] = n.astype(int)
+    return stats
+
+
+def out_of_sample(X, Y, min_train=MIN_TRAIN):
+    """
+    Expanding-window forecasts. At origin t the model only uses rows s with
+    s + h <= t (targets already realized). Returns (I, H, A) arrays oos_r2, oos_n.
+    """
+    W, xw, yw = _masked_sums(X, Y)
+    cums = [np.cumsum(a, axis=-1) for a in (W, xw, yw, xw * xw, xw * yw)]
+    n_periods = X.shape[0]
+
+    oos_r2 = np.full(W.shape[:-1], np.nan)
+    oos_n = np.zeros(W.shape[:-1], dtype=int)
+    for h in range(1, Y.shape[0] + 1):
+        # Training stats available at origin t: cumulative sums through row t - h
+        n, sx, sy, sxx, sxy = [
+            np.concatenate([np.zeros(c[:, h - 1].shape[:-1] + (h,)), c[:, h - 1, :, : n_periods - h]], -1)
+            for c in cums
+        ]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            beta = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+            alpha = (sy - beta * sx) / n
+            mean = sy / n
+
+        x_t = np.broadcast_to(np.nan_to_num(X).T[:, None, :], beta.shape)
+        y_t = yw[:, h - 1]
+        live = (W[:, h - 1] > 0) & (n >= min_train) & np.isfinite(beta)
+
+        err_model = np.where(live, y_t - (alpha + beta * x_t), 0.0)
+        err_mean = np.where(live, y_t - mean, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            oos_r2[:, h - 1] = 1.0 - (err_model ** 2).sum(-1) / (err_mean ** 2).sum(-1)
+        oos_n[:, h - 1] = live.sum(-1)
+
+    oos_r2[oos_n == 0] = np.nan
+    return oos_r2, oos_n
+
+
+def run_lead_lag(macro, prices, max_horizon=MAX_HORIZON, lag=PUBLICATION_LAG, min_train=MIN_TRAIN):
+    """Coefficient / t-stat table with one row per indicator x asset x horizon."""
+    X, Y, indicators, assets, _ = build_design(macro, prices, max_horizon, lag)
+    stats = fit_lead_lag(X, Y)
+    stats["oos_r2"], stats["oos_n"] = out_of_sample(X, Y, min_train)
+
+    idx = pd.MultiIndex.from_product(
+        [indicators, range(1, max_horizon + 1), assets], names=["indicator", "horizon", "asset"]
+    )
+    table = pd.DataFrame({k: v.ravel() for k, v in stats.items()}, index=idx).reset_index()
+    return table[["indicator", "asset", "horizon", "alpha", "beta", "se_beta", "t_stat",
+                  "r2", "nobs", "oos_r2", "oos_n"]]
+
+
+if __name__ == "__main__":
+    from scripts.data_pipeline.load_local_data import load_fred_panel, load_yahoo_panel
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-horizon", type=int, default=MAX_HORIZON)
+    parser.add_argument("--lag", type=int, default=PUBLICATION_LAG)
+    args = parser.parse_args()
+
+    table = run_lead_lag(load_fred_panel(), load_yahoo_panel(), args.max_horizon, args.lag)
+    table.to_csv(OUTPUT_PATH, index=False)
+    print(f"✅ Lead-lag regression table saved to {OUTPUT_PATH}")
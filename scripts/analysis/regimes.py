@@ -0,0 +1,155 @@
+# scripts/analysis/regimes.py
+"""
+State-dependent (regime) conditional statistics, after Di Bonaventura & Morini (2024).
+
+Each month is labelled, per macro indicator, by the indicator's level tercile
+(low / mid / high) and its direction (falling / rising over the last few
+months). Conditional correlations between indicator changes and asset returns,
+and conditional mean returns, are then computed for every
+indicator x regime x asset cell in one grouped pass.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from scripts.data_pipeline.load_local_data import YIELD_SERIES, to_monthly
+
+# indicator -> transform giving the "level" whose tercile defines the state
+INDICATORS = {
+    "CPIAUCNS": "yoy",   # inflation rate, not the price index
+    "GDP": "yoy",        # growth rate (quarterly, carried forward to months)
+    "UNRATE": "level",
+    "USSLIND": "level",
+}
+
+LEVELS = ["low", "mid", "high"]
+DIRECTIONS = ["falling", "rising"]
+REGIMES = [f"{level}/{direction}" for level in LEVELS for direction in DIRECTIONS]
+
+DIRECTION_WINDOW = 3   # months over which the direction is measured
+MIN_OBS = 6            # cells with fewer months are reported as NaN
+
+
+@dataclass
+class RegimeCube:
+    indicators: list
+    regimes: list
+    assets: list
+    regime_index: pd.DataFrame   # (months, indicators) int8 codes into `regimes`, -1 = unknown
+    count: np.ndarray            # (I, K) months per cell
+    corr: np.ndarray             # (I, K, A) corr(Δindicator, asset return) within regime
+    mean_return: np.ndarray      # (I, K, A) mean monthly asset return within regime
+
+    def slice(self, indicator, stat="corr"):
+        """Regimes x assets DataFrame for one indicator."""
+        i = self.indicators.index(indicator)
+        values = self.corr[i] if stat == "corr" else self.mean_return[i]
+        return pd.DataFrame(values, index=self.regimes, columns=self.assets)
+
+    def current_regime(self, indicator):
+        code = self.regime_index[indicator].replace(-1, np.nan).dropna()
+        return (self.regimes[int(code.iloc[-1])], code.index[-1]) if len(code) else (None, None)
+
+    def to_frame(self):
+        """Long table: one row per indicator x regime x asset."""
+        idx = pd.MultiIndex.from_product(
+            [self.indicators, self.regimes, self.assets], names=["indicator", "regime", "asset"]
+        )
+        return pd.DataFrame({
+            "count": np.repeat(self.count, len(self.assets)).ravel(),
+            "corr": self.corr.ravel(),
+            "mean_return": self.mean_return.ravel(),
+        }, index=idx).reset_index()
+
+
+def indicator_levels(macro):
+    """Monthly indicator levels after each indicator's transform."""
+    monthly = to_monthly(macro).ffill(limit=2)   # carry quarterly prints across the quarter
+    columns = {}
+    for name, transform in INDICATORS.items():
+        if name not in monthly:
+            continue
+        series = monthly[name]
+        columns[name] = (series / series.shift(12) - 1.0) * 100.0 if transform == "yoy" else series
+    return pd.DataFrame(columns)
+
+
+def classify_regimes(levels):
+    """Regime codes (level tercile * 2 + direction) per month and indicator; -1 where unknown."""
+    values = levels.to_numpy()
+    valid = ~np.isnan(values)
+
+    cutoffs = np.nanquantile(values, [1 / 3, 2 / 3], axis=0)                          # (2, I)
+    tercile = (values[None] > cutoffs[:, None, :]).sum(axis=0)                         # (T, I)
+    change = values - np.vstack([np.full((DIRECTION_WINDOW, values.shape[1]), np.nan),
+                                 values[:-DIRECTION_WINDOW]])
+    rising = (change > 0).astype(int)
+
+    codes = np.where(valid & ~np.isnan(change), tercile * len(DIRECTIONS) + rising, -1)
+    return pd.DataFrame(codes.astype(np.int8), index=levels.index, columns=levels.columns)
+
+
+def build_regime_cube(macro, prices):
+    """
+    Build the regime index and all conditional statistics.
+
+    macro:  date-indexed FRED panel by series id.
+    prices: date-indexed Yahoo price panel; yield series (YIELD_SERIES) are
+            dropped, since their log changes are not returns (as in monte_carlo).
+    """
+    levels = indicator_levels(macro)
+    prices = prices.drop(columns=[c for c in YIELD_SERIES if c in prices.columns])
+    returns = np.log(to_monthly(prices)).diff()
+    levels, returns = levels.align(returns, join="inner", axis=0)
+    keep = returns.notna().all(axis=1)
+    levels, returns = levels[keep], returns[keep]
+
+    regime_index = classify_regimes(levels)
+    codes = regime_index.to_numpy()
+    X = levels.diff().to_numpy()
+    R = returns.to_numpy()
+
+    # One-hot membership (T, I, K); months with an unknown regime or Δ belong to no cell
+    G = (codes[:, :, None] == np.arange(len(REGIMES))[None, None, :]) & ~np.isnan(X)[:, :, None]
+    G = G.astype(float)
+    X = np.nan_to_num(X)
+
+    n = G.sum(axis=0)                                          # (I, K)
+    sx = np.einsum("tik,ti->ik", G, X)
+    sxx = np.einsum("tik,ti->ik", G, X * X)
+    sy = np.einsum("tik,ta->ika", G, R)
+    syy = np.einsum("tik,ta->ika", G, R * R)
+    sxy = np.einsum("tik,ti,ta->ika", G, X, R)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        nn = n[:, :, None]
+        cov = nn * sxy - sx[:, :, None] * sy
+        var_x = (n * sxx - sx * sx)[:, :, None]
+        var_y = nn * syy - sy * sy
+        corr = cov / np.sqrt(var_x * var_y)
+        mean_return = sy / nn
+
+    sparse = (n < MIN_OBS)[:, :, None]
+    corr = np.where(sparse, np.nan, corr)
+    mean_return = np.where(sparse, np.nan, mean_return)
+
+    return RegimeCube(
+        indicators=list(levels.columns),
+        regimes=list(REGIMES),
+        assets=list(returns.columns),
+        regime_index=regime_index,
+        count=n.astype(int),
+        corr=corr,
+        mean_return=mean_return,
+    )
+
+
+if __name__ == "__main__":
+    from scripts.data_pipeline.load_local_data import load_fred_panel, load_yahoo_panel
+
+    cube = build_regime_cube(load_fred_panel(), load_yahoo_panel())
+    cube.to_frame().to_csv("data/processed/regime_conditional_stats.csv", index=False)
+    cube.regime_index.to_csv("data/processed/regime_index.csv")
+    print("✅ Regime-conditional statistics saved.")
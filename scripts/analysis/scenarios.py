@@ -0,0 +1,181 @@
+# scripts/analysis/scenarios.py
+"""
+Historical scenario engine: for each named episode window, compute drawdowns,
+cumulative returns and time-to-recovery for every asset in the Yahoo panel at
+once, plus the change in each FRED indicator over the same window. Yield
+series (YIELD_SERIES, e.g. the 10Y Treasury yield) are not prices, so they only
+get their change in basis points.
+"""
+
+import numpy as np
+import pandas as pd
+
+from scripts.data_pipeline.load_local_data import YIELD_SERIES
+
+# Named episode windows (peak-to-trough of the S&P 500 where applicable)
+EPISODES = {
+    "2008 Financial Crisis": ("2007-10-09", "2009-03-09"),
+    "2011 US Downgrade": ("2011-07-22", "2011-10-03"),
+    "2018 Q4 Rate-Hike Selloff": ("2018-09-20", "2018-12-24"),
+    "COVID-19 Crash": ("2020-02-19", "2020-03-23"),
+    "2022 Rate Hikes": ("2022-01-03", "2022-10-12"),
+}
+
+# Longest gap between prints before an indicator is treated as discontinued
+MAX_PRINT_GAP = pd.Timedelta(days=100)
+
+# Results keyed by (episode, start, end, universe, data fingerprint)
+_SCENARIO_CACHE = {}
+
+
+def _fingerprint(df):
+    """Shape, bounds and a content hash, so values revised in place miss the cache."""
+    if not len(df):
+        return (df.shape,)
+    content = int(pd.util.hash_pandas_object(df, index=True).sum())
+    return (df.shape, df.index[0], df.index[-1], content)
+
+
+def _episode_asset_stats(dates, values, start, end):
+    """Vectorized stats for all assets (columns of `values`) over one window."""
+    lo = np.searchsorted(dates, np.datetime64(start), side="left")
+    hi = np.searchsorted(dates, np.datetime64(end), side="right")
+    n_assets = values.shape[1]
+
+    if hi - lo < 2:
+        nan = np.full(n_assets, np.nan)
+        nat = np.full(n_assets, np.datetime64("NaT"), dtype=dates.dtype)
+        return {
+            "cumulative_return": nan, "max_drawdown": nan,
+            "peak_date": nat, "trough_date": nat, "recovery_date": nat, "recovery_days": nan,
+        }
+
+    window = values[lo:hi]
+    running_peak = np.maximum.accumulate(window, axis=0)
+    drawdown = window / running_peak - 1.0
+
+    trough_idx = drawdown.argmin(axis=0)
+    cols = np.arange(n_assets)
+    peak_level = running_peak[trough_idx, cols]
+    peak_idx = (window[: trough_idx.max() + 1] == peak_level).argmax(axis=0)
+
+    # First date after the trough (anywhere in the history) that regains the prior peak
+    after_trough = np.arange(len(values))[:, None] > (lo + trough_idx)[None, :]
+    recovered = after_trough & (values >= peak_level[None, :])
+    has_recovered = recovered.any(axis=0)
+    recovery_idx = recovered.argmax(axis=0)
+
+    trough_dates = dates[lo + trough_idx]
+    recovery_dates = np.where(has_recovered, dates[recovery_idx], np.datetime64("NaT"))
+
+    return {
+        "cumulative_return": window[-1] / window[0] - 1.0,
+        "max_drawdown": drawdown[trough_idx, cols],
+        "peak_date": dates[lo + peak_idx],
+        "trough_date": trough_dates,
+        "recovery_date": recovery_dates,
+        "recovery_days": (recovery_dates - trough_dates) / np.timedelta64(1, "D"),
+    }
+
+
+def _episode_yield_changes(dates, values, start, end):
+    """Change in basis points between the first level in the window and the last."""
+    lo = np.searchsorted(dates, np.datetime64(start), side="left")
+    hi = np.searchsorted(dates, np.datetime64(end), side="right")
+    if hi - lo < 2:
+        return np.full(values.shape[1], np.nan)
+    return (values[hi - 1] - values[lo]) * 100.0
+
+
+def _episode_macro_changes(macro, start, end):
+    """
+    Change in each indicator between the last prints on or before start and end.
+    NaN when nothing new was released in between (the change is unknown, not zero).
+    """
+    stamps = pd.DatetimeIndex([start, end])
+    at = macro.ffill().reindex(stamps, method="ffill")
+
+    released = pd.DataFrame(np.where(macro.notna(), macro.index.values[:, None], np.datetime64("NaT")),
+                            index=macro.index, columns=macro.columns).ffill()
+    released = released.reindex(stamps, method="ffill")
+    at = at.mask(pd.DataFrame([released.iloc[0] == released.iloc[1]] * 2, index=stamps))
+
+    # Don't carry a discontinued series (e.g. USSLIND) forward past its last print
+    last_print = macro.apply(pd.Series.last_valid_index)
+    stale = stamps.values[:, None] > (last_print + MAX_PRINT_GAP).values[None, :]
+    at = at.mask(stale)
+    return at.iloc[1] - at.iloc[0]
+
+
+def run_scenarios(prices, macro=None, episodes=None, universe=None):
+    """
+    Compute per-episode asset statistics and macro-indicator changes.
+
+    prices:   date-indexed wide price panel (e.g. load_yahoo_panel()).
+    macro:    optional date-indexed wide indicator panel (e.g. load_fred_panel()).
+    episodes: {name: (start, end)}; defaults to EPISODES.
+    universe: subset of price columns; defaults to all of them.
+
+    Returns (asset_stats, macro_changes): a long DataFrame with one row per
+    episode x asset, and a DataFrame with one row per episode x indicator.
+    Yield series have only yield_change_bp filled in; price assets have it NaN.
+    Episodes outside the data range yield NaN rows rather than being dropped.
+    """
+    episodes = EPISODES if episodes is None else episodes
+    universe = tuple(prices.columns if universe is None else universe)
+    panel = prices.loc[:, list(universe)].sort_index()
+    price_assets = [c for c in universe if c not in YIELD_SERIES]
+    yields = [c for c in universe if c in YIELD_SERIES]
+
+    dates = panel.index.values
+    values = panel[price_assets].to_numpy(dtype=float)
+    yield_values = panel[yields].to_numpy(dtype=float)
+    price_key = _fingerprint(panel)
+    macro_key = _fingerprint(macro) if macro is not None else None
+
+    asset_frames, macro_frames = [], []
+    for name, (start, end) in episodes.items():
+        key = (name, start, end, universe, price_key, macro_key)
+        if key not in _SCENARIO_CACHE:
+            stats = pd.DataFrame(_episode_asset_stats(dates, values, start, end))
+            stats.insert(0, "asset", price_assets)
+            if yields:
+                yield_rows = pd.DataFrame({"asset": yields,
+                                           "yield_change_bp": _episode_yield_changes(dates, yield_values, start, end)})
+                stats = pd.concat([stats, yield_rows], ignore_index=True)
+            stats = stats.reindex(columns=list(stats.columns.drop("yield_change_bp", errors="ignore"))
+                                  + ["yield_change_bp"])
+            stats.insert(0, "episode", name)
+
+            changes = None
+            if macro is not None:
+                delta = _episode_macro_changes(macro, start, end)
+                changes = pd.DataFrame({
+                    "episode": name,
+                    "indicator": delta.index,
+                    "change": delta.values,
+                })
+            _SCENARIO_CACHE[key] = (stats, changes)
+
+        stats, changes = _SCENARIO_CACHE[key]
+        asset_frames.append(stats)
+        if changes is not None:
+            macro_frames.append(changes)
+
+    asset_stats = pd.concat(asset_frames, ignore_index=True)
+    macro_changes = pd.concat(macro_frames, ignore_index=True) if macro_frames else None
+    return asset_stats, macro_changes
+
+
+def clear_cache():
+    _SCENARIO_CACHE.clear()
+
+
+if __name__ == "__main__":
+    from scripts.data_pipeline.load_local_data import load_fred_panel, load_yahoo_panel
+
+    asset_stats, macro_changes = run_scenarios(load_yahoo_panel(), load_fred_panel())
+
+    asset_stats.to_csv("data/processed/scenario_asset_stats.csv", index=False)
+    macro_changes.to_csv("data/processed/scenario_macro_changes.csv", index=False)
+    print("✅ Scenario results saved.")
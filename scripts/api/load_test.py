@@ -0,0 +1,152 @@
+# scripts/api/load_test.py
+"""
+Concurrent load test for series_api.py.
+
+Starts the API in-process on a free port (or targets --url) and runs each
+scenario with 1, 4 and 16 keep-alive client threads:
+
+    cold         every request is a new (uncached) date range
+    warm         a small set of requests repeated (LRU cache hits)
+    revalidate   the warm set sent with If-None-Match (bodyless 304s)
+
+and reports requests/second and latency percentiles per scenario.
+
+    python -m scripts.api.load_test --requests 400
+"""
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+WARM_PATHS = [
+    "/series/CPIAUCNS",
+    "/series/sp500?start=2020-01-01&freq=M",
+    "/series/UNRATE?freq=Q&format=csv",
+    "/panel?ids=CPIAUCNS,UNRATE,sp500,gold&freq=M",
+    "/panel?ids=sp500,gold,oil,bond10y&how=inner&format=arrow",
+    "/correlations?method=spearman",
+    "/correlations?ids=SP500,GOLD,CPIAUCNS",
+]
+
+
+def cold_paths(n, seed=0):
+    """n distinct date-range requests, so each one misses the cache."""
+    rng = random.Random(seed)
+    ids = ["sp500", "gold", "oil", "bond10y", "eurusd", "reit_etf", "CPIAUCNS", "UNRATE"]
+    paths = set()
+    while len(paths) < n:
+        start = f"{rng.randint(2010, 2018)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        end = f"{rng.randint(2019, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        if rng.random() < 0.5:
+            paths.add(f"/series/{rng.choice(ids)}?start={start}&end={end}")
+        else:
+            pair = ",".join(rng.sample(ids, 3))
+            paths.add(f"/panel?ids={pair}&start={start}&end={end}&freq={rng.choice('DWM')}")
+    return sorted(paths)
+
+
+def fetch_etags(host, port, paths):
+    conn = http.client.HTTPConnection(host, port)
+    tags = {}
+    for path in paths:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        tags[path] = response.getheader("ETag")
+    conn.close()
+    return tags
+
+
+def run_clients(host, port, paths, n_clients, etags=None):
+    """Split paths across n_clients keep-alive connections; returns (elapsed, latencies, statuses)."""
+    latencies = [[] for _ in range(n_clients)]
+    statuses = [[] for _ in range(n_clients)]
+
+    def client(i):
+        conn = http.client.HTTPConnection(host, port)
+        for path in paths[i::n_clients]:
+            headers = {"If-None-Match": etags[path]} if etags else {}
+            start = time.perf_counter()
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            latencies[i].append(time.perf_counter() - start)
+            statuses[i].append(response.status)
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(n_clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return elapsed, np.concatenate([np.array(l) for l in latencies]), sum(statuses, [])
+
+
+def summarize(scenario, n_clients, elapsed, latencies, statuses):
+    ms = latencies * 1000.0
+    return {
+        "scenario": scenario,
+        "clients": n_clients,
+        "requests": len(latencies),
+        "req_per_s": len(latencies) / elapsed,
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "errors": sum(1 for s in statuses if s >= 400),
+        "not_modified": sum(1 for s in statuses if s == 304),
+    }
+
+
+def load_test(host, port, n_requests=400, clients=(1, 4, 16)):
+    results = []
+    for n_clients in clients:
+        cold = cold_paths(n_requests, seed=n_clients)
+        results.append(summarize("cold", n_clients, *run_clients(host, port, cold, n_clients)))
+
+        warm = (WARM_PATHS * (n_requests // len(WARM_PATHS) + 1))[:n_requests]
+        results.append(summarize("warm", n_clients, *run_clients(host, port, warm, n_clients)))
+
+        tags = fetch_etags(host, port, WARM_PATHS)
+        results.append(summarize("revalidate", n_clients, *run_clients(host, port, warm, n_clients, tags)))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", help="Target a running API instead of starting one in-process")
+    parser.add_argument("--requests", type=int, default=400, help="Requests per scenario and client count")
+    parser.add_argument("--clients", default="1,4,16")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        from scripts.api.series_api import STATE, make_server
+        server = make_server(port=0, quiet=True)
+        host, port = server.server_address
+        STATE.current()
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    clients = tuple(int(c) for c in args.clients.split(","))
+    results = load_test(host, port, args.requests, clients)
+
+    print(f"{'scenario':<11} {'clients':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'304s':>6} {'errors':>6}")
+    for r in results:
+        print(f"{r['scenario']:<11} {r['clients']:>7} {r['req_per_s']:>9.1f} {r['p50_ms']:>8.2f} "
+              f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['not_modified']:>6} {r['errors']:>6}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if server:
+        server.shutdown()
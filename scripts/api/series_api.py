@@ -0,0 +1,335 @@
+# scripts/api/series_api.py
+"""
+Read-only HTTP API over the local series, for Tableau / Power BI web data
+connectors and anything else that speaks HTTP. Standard library server only.
+
+    GET /series                                  ids with their date bounds
+    GET /series/<id>?start=&end=&freq=           one series (FRED id, Yahoo label or World Bank column)
+    GET /panel?ids=CPIAUCNS,sp500&how=outer      several series aligned on date
+    GET /correlations?method=spearman&ids=...    saved correlation matrix (or a sub-matrix)
+    GET /health                                  data version and cache statistics
+
+    freq:   D (as stored), W, M, Q, A (last observation in each period)
+    format: json (default), csv or arrow, via ?format= or the Accept header
+
+Every response carries an ETag derived from the data version (a hash of the
+source files' sizes and mtimes) and the normalized request, so clients can
+revalidate with If-None-Match and get a bodyless 304. Rendered bodies are kept
+in an LRU cache keyed the same way; a data change produces a new version, so
+stale entries simply stop being hit.
+
+    python -m scripts.api.series_api --port 8765
+"""
+
+import argparse
+import functools
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from scripts.data_pipeline.load_local_data import CORRELATION_METHODS, PROCESSED_DIR, data_version
+from scripts.data_pipeline.series_store import build_series_store
+
+FREQUENCIES = {"D": None, "W": "W", "M": "M", "Q": "Q", "A": "A"}
+CONTENT_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+CACHE_SIZE = 512
+VERSION_CHECK_SECONDS = 5.0
+
+
+class APIError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ===================================================================
+# ==========  DATA VERSION + STORE  =================================
+# ===================================================================
+class DataSnapshot:
+    """
+    One loaded data version: the store and the id index over it. Never mutated
+    after loading, so a request keeps a consistent view even if a reload
+    happens meanwhile. Hashes and compares by version (it is the render cache key).
+    """
+
+    def __init__(self, version, store):
+        self.version = version
+        self.store = store
+        self.index = {}   # id.lower() -> (source, panel or None, stored name, id)
+        series, panels = store.names()
+        for name in series:
+            source, _, series_id = name.rpartition(":")
+            self.index[series_id.lower()] = (source or "fred", None, name, series_id)
+        for panel in panels:
+            if panel == "yahoo":    # inner-joined; the symbols are served from their own series
+                continue
+            for column in store.columns(panel):
+                self.index.setdefault(column.lower(), (panel, panel, column, column))
+
+    def __hash__(self):
+        return hash(self.version)
+
+    def __eq__(self, other):
+        return isinstance(other, DataSnapshot) and other.version == self.version
+
+    def frame(self, series_id, start=None, end=None):
+        """date/value view for one id (case-insensitive)."""
+        try:
+            _, panel, name, series_id = self.index[series_id.lower()]
+        except KeyError:
+            raise APIError(404, f"Unknown series id: {series_id}")
+        if panel is None:
+            return series_id, self.store.series(name, start, end)
+        df = self.store.panel(panel, start, end, columns=[name])
+        return series_id, df.rename(columns={name: "value"})
+
+    def listing(self):
+        rows = []
+        for key, (source, panel, name, series_id) in sorted(self.index.items()):
+            first, last = self.store.bounds(name) if panel is None else self.store.bounds(panel, name)
+            rows.append({"id": series_id, "source": source, "start": first.date().isoformat(),
+                         "end": last.date().isoformat()})
+        return pd.DataFrame(rows)
+
+
+class DataState:
+    """The current DataSnapshot, reloaded when the data version changes (checked at most every few seconds)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked = 0.0
+        self.snapshot = None
+
+    def current(self):
+        now = time.monotonic()
+        snapshot = self.snapshot
+        if snapshot is not None and now - self._checked < VERSION_CHECK_SECONDS:
+            return snapshot
+        with self._lock:
+            if self.snapshot is None or now - self._checked >= VERSION_CHECK_SECONDS:
+                version = data_version()
+                if self.snapshot is None or version != self.snapshot.version:
+                    self.snapshot = DataSnapshot(version, build_series_store())
+                    render.cache_clear()   # old-version entries would never be hit again
+                self._checked = now
+            return self.snapshot
+
+
+STATE = DataState()
+
+
+# ===================================================================
+# ==========  QUERIES  ==============================================
+# ===================================================================
+def _resample(df, freq):
+    rule = FREQUENCIES[freq]
+    if rule is None:
+        return df
+    return df.set_index("date").resample(rule).last().dropna(how="all").reset_index()
+
+
+def series_frame(data, series_id, start, end, freq):
+    name, df = data.frame(series_id, start, end)
+    return _resample(df.dropna(), freq)
+
+
+def panel_frame(data, ids, start, end, freq, how):
+    columns = {}
+    for series_id in ids:
+        name, df = data.frame(series_id, start, end)
+        columns[name] = df.dropna().set_index("date")["value"]
+    panel = pd.concat(columns, axis=1, join=how).sort_index()
+    panel.index.name = "date"
+    return _resample(panel.reset_index(), freq)
+
+
+def correlation_frame(method, ids):
+    path = os.path.join(PROCESSED_DIR, f"{method}_correlation_matrix.csv")
+    if not os.path.exists(path):
+        raise APIError(404, f"No saved {method} correlation matrix")
+    matrix = pd.read_csv(path, index_col=0)
+    if ids:
+        lookup = {c.lower(): c for c in matrix.columns}
+        missing = [i for i in ids if i.lower() not in lookup]
+        if missing:
+            raise APIError(404, f"Not in the correlation matrix: {', '.join(missing)}")
+        names = [lookup[i.lower()] for i in ids]
+        matrix = matrix.loc[names, names]
+    matrix.index.name = "variable"
+    return matrix.reset_index()
+
+
+# ===================================================================
+# ==========  RENDERING (LRU-cached per version + request)  =========
+# ===================================================================
+def encode(df, fmt):
+    if fmt == "csv":
+        return df.to_csv(index=False, date_format="%Y-%m-%d").encode("utf-8")
+    if fmt == "arrow":
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise APIError(406, "Arrow output needs pyarrow installed")
+        sink = io.BytesIO()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue()
+    return df.to_json(orient="split", index=False, date_format="iso", date_unit="s").encode("utf-8")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def render(data, route, key, fmt):
+    """Body for a normalized request against one DataSnapshot (cached per data version)."""
+    params = dict(key)
+    if route == "series_list":
+        df = data.listing()
+    elif route == "series":
+        df = series_frame(data, params["id"], params["start"], params["end"], params["freq"])
+    elif route == "panel":
+        df = panel_frame(data, params["ids"], params["start"], params["end"], params["freq"], params["how"])
+    elif route == "correlations":
+        df = correlation_frame(params["method"], params["ids"])
+    else:
+        raise APIError(404, f"Unknown route: {route}")
+    return encode(df, fmt)
+
+
+def etag(version, route, key, fmt):
+    digest = hashlib.sha1(repr((version, route, key, fmt)).encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def parse_request(path, query, accept=""):
+    """Normalize a request into (route, key, fmt); key is hashable and order-independent."""
+    q = {k: v[-1] for k, v in parse_qs(query).items()}
+
+    fmt = q.get("format")
+    if fmt is None:
+        fmt = "arrow" if "arrow" in accept else "csv" if "text/csv" in accept else "json"
+    if fmt not in CONTENT_TYPES:
+        raise APIError(400, f"format must be one of {', '.join(CONTENT_TYPES)}")
+
+    freq = q.get("freq", "D").upper()
+    if freq not in FREQUENCIES:
+        raise APIError(400, f"freq must be one of {', '.join(FREQUENCIES)}")
+
+    def date(name):
+        value = q.get(name)
+        if value is None:
+            return None
+        try:
+            return pd.Timestamp(value).date().isoformat()
+        except ValueError:
+            raise APIError(400, f"Invalid {name} date: {value}")
+
+    ids = tuple(i.strip() for i in q.get("ids", "").split(",") if i.strip())
+    parts = [p for p in path.split("/") if p]
+
+    if parts == ["series"]:
+        return "series_list", (), fmt
+    if len(parts) == 2 and parts[0] == "series":
+        return "series", (("end", date("end")), ("freq", freq), ("id", parts[1]), ("start", date("start"))), fmt
+    if parts == ["panel"]:
+        if not ids:
+            raise APIError(400, "panel needs ids=<id>,<id>,...")
+        how = q.get("how", "outer")
+        if how not in ("inner", "outer"):
+            raise APIError(400, "how must be inner or outer")
+        return "panel", (("end", date("end")), ("freq", freq), ("how", how), ("ids", ids),
+                         ("start", date("start"))), fmt
+    if parts == ["correlations"]:
+        method = q.get("method", "pearson").lower()
+        if method not in CORRELATION_METHODS:
+            raise APIError(400, f"method must be one of {', '.join(CORRELATION_METHODS)}")
+        return "correlations", (("ids", ids), ("method", method)), fmt
+    raise APIError(404, f"Unknown path: {path}")
+
+
+# ===================================================================
+# ==========  HTTP  =================================================
+# ===================================================================
+class SeriesAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"      # keep-alive for repeat clients
+    disable_nagle_algorithm = True     # headers and body go out in separate writes
+    server_version = "MacroSeriesAPI/1.0"
+    quiet = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        try:
+            if url.path.rstrip("/") == "/health":
+                return self._send_json(200, self._health())
+            data = STATE.current()
+            route, key, fmt = parse_request(url.path, url.query, self.headers.get("Accept", ""))
+            tag = etag(data.version, route, key, fmt)
+            if tag in [t.strip() for t in self.headers.get("If-None-Match", "").split(",")]:
+                return self._send(304, b"", None, tag)
+            body = render(data, route, key, fmt)
+            self._send(200, body, CONTENT_TYPES[fmt], tag)
+        except APIError as e:
+            self._send_json(e.status, {"error": str(e)})
+        except Exception as e:   # keep serving; report the failure to the client
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def _health(self):
+        info = render.cache_info()
+        return {"version": STATE.current().version, "cache": {
+            "hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}}
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload).encode("utf-8"), CONTENT_TYPES["json"], None)
+
+    def _send(self, status, body, content_type, tag):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if tag:
+            self.send_header("ETag", tag)
+            self.send_header("Cache-Control", "no-cache")    # always revalidate; 304s are cheap
+            self.send_header("Vary", "Accept")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+class SeriesAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128   # the default backlog of 5 drops connects under bursts (1 s SYN retry)
+
+
+def make_server(host="127.0.0.1", port=8765, quiet=False):
+    handler = type("Handler", (SeriesAPIHandler,), {"quiet": quiet})
+    return SeriesAPIServer((host, port), handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--quiet", action="store_true", help="Don't log each request")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.quiet)
+    data = STATE.current()
+    print(f"✅ Serving {len(data.index)} series (data version {data.version}) on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("👋 Stopped.")
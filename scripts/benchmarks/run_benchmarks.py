@@ -0,0 +1,394 @@
+# scripts/benchmarks/run_benchmarks.py
+"""
+Benchmark suite over synthetic data (see synthetic_data.py).
+
+Cases are written pytest-benchmark style: each receives a `benchmark` callable
+that times the function it is given (after one warm-up call) and returns its
+result. Timings are saved as JSON under data/benchmarks/ and can be compared
+against an earlier run for regressions:
+
+    python -m scripts.benchmarks.run_benchmarks --scale small
+    python -m scripts.benchmarks.run_benchmarks --scale medium --format parquet --compare latest
+    python -m scripts.benchmarks.run_benchmarks --scale small -k etl --db-url postgresql://...
+
+ETL cases run against a throwaway SQLite file by default (set through
+MACRO_DATABASE_URL before scripts.db is imported), or against --db-url. The
+pandas correlation case reads that database through the real
+correlation_matrix.load_and_prepare_data, so it fills the tables first. The ETL
+cases rewrite their table each round (DELETE + INSERT), so they get the same
+warm-up and rounds as every other case.
+"""
+
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from scripts.benchmarks.synthetic_data import SCALES, YEARS, dataset_root, generate
+
+RESULTS_DIR = os.path.join("data", "benchmarks")
+REGRESSION_THRESHOLD = 0.10   # median slower by more than 10% => regression
+
+CASES = []
+
+
+def case(group, rounds=5):
+    """Register a benchmark case: func(benchmark, ctx)."""
+    def decorator(func):
+        CASES.append({"name": func.__name__.replace("bench_", ""), "group": group, "rounds": rounds, "func": func})
+        return func
+    return decorator
+
+
+class Benchmark:
+    """Minimal stand-in for pytest-benchmark's fixture."""
+
+    def __init__(self, rounds, warmup=True):
+        self.rounds = rounds
+        self.warmup = warmup
+        self.times = []
+        self.extra_info = {}
+
+    def __call__(self, func, *args, **kwargs):
+        if self.warmup and self.rounds > 1:
+            func(*args, **kwargs)
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.times.append(time.perf_counter() - start)
+        return result
+
+    def stats(self):
+        times = self.times
+        return {
+            "min": min(times),
+            "max": max(times),
+            "mean": statistics.fmean(times),
+            "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "median": statistics.median(times),
+            "rounds": len(times),
+            "ops": 1.0 / statistics.fmean(times),
+        }
+
+
+class Context:
+    """Paths and shared inputs for one synthetic dataset."""
+
+    def __init__(self, root, manifest):
+        self.root = root
+        self.manifest = manifest
+        self.fred_dir = os.path.join(root, "data", "raw", "fred")
+        self.yahoo_dir = os.path.join(root, "data", "raw", "yahoo")
+        ext = "parquet" if manifest["format"] == "parquet" else "csv"
+        self.worldbank_path = os.path.join(root, "data", "raw", "worldbank", f"worldbank_us_macro.{ext}")
+        self.worldbank_csv = os.path.join(root, "data", "processed", "worldbank_us_macro.csv")
+        self._cache = {}
+
+    def cached(self, key, build):
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def fred_panel(self):
+        from scripts.data_pipeline.load_local_data import load_fred_panel
+        return self.cached("fred", lambda: load_fred_panel(self.fred_dir))
+
+    def yahoo_panel(self):
+        from scripts.data_pipeline.load_local_data import load_yahoo_panel
+        return self.cached("yahoo", lambda: load_yahoo_panel(self.yahoo_dir))
+
+    def worldbank_panel(self):
+        from scripts.data_pipeline.load_local_data import load_worldbank_panel
+        return self.cached("worldbank", lambda: load_worldbank_panel(self.worldbank_path))
+
+
+# ===================================================================
+# ==========  LOADERS  ==============================================
+# ===================================================================
+@case("loaders")
+def bench_load_fred_panel(benchmark, ctx):
+    from scripts.data_pipeline.load_local_data import load_fred_panel
+    panel = benchmark(load_fred_panel, ctx.fred_dir)
+    benchmark.extra_info["cells"] = int(panel.size)
+
+
+@case("loaders")
+def bench_load_yahoo_panel(benchmark, ctx):
+    from scripts.data_pipeline.load_local_data import load_yahoo_panel
+    panel = benchmark(load_yahoo_panel, ctx.yahoo_dir)
+    benchmark.extra_info["cells"] = int(panel.size)
+
+
+@case("loaders")
+def bench_load_worldbank_panel(benchmark, ctx):
+    from scripts.data_pipeline.load_local_data import load_worldbank_panel
+    panel = benchmark(load_worldbank_panel, ctx.worldbank_path)
+    benchmark.extra_info["cells"] = int(panel.size)
+
+
+@case("loaders", rounds=3)
+def bench_build_series_store(benchmark, ctx):
+    from scripts.data_pipeline.series_store import build_series_store
+    store = benchmark(build_series_store, ctx.fred_dir, ctx.yahoo_dir, ctx.worldbank_path)
+    benchmark.extra_info["bytes"] = int(store.nbytes)
+
+
+# ===================================================================
+# ==========  YAHOO MERGE  ==========================================
+# ===================================================================
+@case("merge")
+def bench_yahoo_align(benchmark, ctx):
+    """Date alignment of the already-read per-asset series (the concat in load_yahoo_panel)."""
+    panel = ctx.yahoo_panel()
+    columns = {label: panel[label].dropna() for label in panel.columns}
+    aligned = benchmark(lambda: pd.concat(columns, axis=1, join="inner").sort_index())
+    benchmark.extra_info["cells"] = int(aligned.size)
+
+
+@case("merge")
+def bench_asset_overlay_merge(benchmark, ctx):
+    """The dashboard's indicator x asset merge, repeated for up to 50 assets."""
+    from scripts.data_pipeline.load_local_data import merge_with_asset
+    series = ctx.fred_panel()["CPIAUCNS"].dropna().rename("value").reset_index()
+    prices = ctx.yahoo_panel().reset_index()
+    assets = list(prices.columns[1:51])
+    benchmark(lambda: [merge_with_asset(series, prices, asset) for asset in assets])
+    benchmark.extra_info["assets"] = len(assets)
+
+
+# ===================================================================
+# ==========  FORECAST  =============================================
+# ===================================================================
+@case("forecast")
+def bench_forecast_linear(benchmark, ctx):
+    from scripts.analysis.forecast import forecast_linear
+    series = ctx.fred_panel()["CPIAUCNS"].dropna().rename("value").reset_index()
+    benchmark(forecast_linear, series)
+    benchmark.extra_info["rows"] = len(series)
+
+
+# ===================================================================
+# ==========  DATABASE  =============================================
+# ===================================================================
+def _etl_engine(ctx):
+    def build():
+        from scripts.db.create_tables import metadata
+        from scripts.db.db_connect import engine
+        metadata.create_all(engine)
+        return engine
+    return ctx.cached("engine", build)
+
+
+def _fred_files(ctx):
+    """The ETL's indicator -> CSV mapping for the synthetic FRED files."""
+    return {
+        os.path.basename(path)[len("fred_"):-len(".csv")].upper(): path
+        for path in sorted(glob.glob(os.path.join(ctx.fred_dir, "fred_*.csv")))
+    }
+
+
+def _etl_loaded(ctx):
+    """The benchmark database with all three tables filled by the ETL (once)."""
+    def build():
+        from scripts.db.etl import load_fred, load_worldbank, load_yahoo
+        engine = _etl_engine(ctx)
+        load_worldbank(engine, ctx.worldbank_csv)
+        load_fred(engine, _fred_files(ctx))
+        load_yahoo(engine, ctx.yahoo_dir)
+        return engine
+    return ctx.cached("etl_loaded", build)
+
+
+def _etl_case(func):
+    def run(benchmark, ctx):
+        if ctx.manifest["format"] != "csv":
+            benchmark.extra_info["skipped"] = "ETL reads CSV only"
+            return
+        func(benchmark, ctx, _etl_engine(ctx))
+    run.__name__ = func.__name__
+    return run
+
+
+# ===================================================================
+# ==========  CORRELATIONS  =========================================
+# ===================================================================
+@case("correlations", rounds=3)
+@_etl_case
+def bench_pandas_correlation_input(benchmark, ctx, engine):
+    """correlation_matrix.load_and_prepare_data's SQL + pandas path, against the ETL'd database."""
+    from scripts.analysis.correlation_matrix import load_and_prepare_data
+    _etl_loaded(ctx)
+    df = benchmark(load_and_prepare_data, "postgres")
+    benchmark.extra_info["shape"] = list(df.shape)
+
+
+@case("correlations", rounds=3)
+def bench_duckdb_correlation_input(benchmark, ctx):
+    """The same panel computed by the DuckDB backend over the files in place."""
+    from scripts.db.duckdb_backend import load_correlation_input
+    df = benchmark(load_correlation_input, None, ctx.fred_dir, ctx.yahoo_dir, ctx.worldbank_csv)
+    benchmark.extra_info["shape"] = list(df.shape)
+
+
+@case("correlations", rounds=3)
+def bench_compute_correlations(benchmark, ctx):
+    from scripts.analysis.correlation_matrix import compute_correlations
+    from scripts.db.duckdb_backend import load_correlation_input
+    df = ctx.cached("correlation_input",
+                    lambda: load_correlation_input(fred_dir=ctx.fred_dir, yahoo_dir=ctx.yahoo_dir,
+                                                   worldbank_path=ctx.worldbank_csv))
+    benchmark(compute_correlations, df)
+    benchmark.extra_info["shape"] = list(df.shape)
+
+
+# ===================================================================
+# ==========  ETL  ==================================================
+# ===================================================================
+@case("etl", rounds=3)
+@_etl_case
+def bench_etl_worldbank(benchmark, ctx, engine):
+    from scripts.db.etl import load_worldbank
+    benchmark(load_worldbank, engine, ctx.worldbank_csv)
+
+
+@case("etl", rounds=3)
+@_etl_case
+def bench_etl_fred(benchmark, ctx, engine):
+    from scripts.db.etl import load_fred
+    indicators = _fred_files(ctx)
+    benchmark(load_fred, engine, indicators)
+    benchmark.extra_info["series"] = len(indicators)
+
+
+@case("etl", rounds=3)
+@_etl_case
+def bench_etl_yahoo(benchmark, ctx, engine):
+    from scripts.db.etl import load_yahoo
+    benchmark(load_yahoo, engine, ctx.yahoo_dir)
+    benchmark.extra_info["series"] = ctx.manifest["yahoo_series"]
+
+
+# ===================================================================
+# ==========  RUNNER  ===============================================
+# ===================================================================
+def machine_info():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "commit": commit,
+    }
+
+
+def run_cases(ctx, keyword=None, rounds=None):
+    results = []
+    for spec in CASES:
+        name = f"{spec['group']}.{spec['name']}"
+        if keyword and keyword not in name:
+            continue
+        benchmark = Benchmark(rounds or spec["rounds"])
+        spec["func"](benchmark, ctx)
+        if not benchmark.times:
+            print(f"⏭️  {name}: {benchmark.extra_info.get('skipped', 'skipped')}")
+            continue
+        stats = benchmark.stats()
+        results.append({"name": name, "group": spec["group"], "stats": stats, "extra_info": benchmark.extra_info})
+        print(f"⏱️  {name:<36} median {stats['median'] * 1000:10.2f} ms  ({stats['rounds']} rounds)")
+    return results
+
+
+def save_results(results, manifest, scale, results_dir=RESULTS_DIR):
+    os.makedirs(results_dir, exist_ok=True)
+    stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(results_dir, f"{stamp}_{scale}_{manifest['format']}.json")
+    with open(path, "w") as f:
+        json.dump({
+            "datetime": datetime.datetime.now().isoformat(timespec="seconds"),
+            "scale": scale,
+            "machine_info": machine_info(),
+            "dataset": manifest,
+            "benchmarks": results,
+        }, f, indent=2)
+    return path
+
+
+def latest_result(scale, fmt, exclude=None, results_dir=RESULTS_DIR):
+    paths = sorted(glob.glob(os.path.join(results_dir, f"*_{scale}_{fmt}.json")))
+    paths = [p for p in paths if p != exclude]
+    return paths[-1] if paths else None
+
+
+def compare(results, baseline_path, threshold=REGRESSION_THRESHOLD):
+    """Median-to-median comparison; returns the names that regressed."""
+    with open(baseline_path) as f:
+        baseline = {b["name"]: b["stats"] for b in json.load(f)["benchmarks"]}
+
+    print(f"\n📊 Compared with {baseline_path}")
+    regressed = []
+    for result in results:
+        old = baseline.get(result["name"])
+        if old is None:
+            continue
+        change = result["stats"]["median"] / old["median"] - 1.0
+        flag = "⚠️ " if change > threshold else "✅"
+        if change > threshold:
+            regressed.append(result["name"])
+        print(f"{flag} {result['name']:<36} {old['median'] * 1000:10.2f} -> "
+              f"{result['stats']['median'] * 1000:10.2f} ms  ({change:+.1%})")
+    return regressed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", choices=list(SCALES), default="small")
+    parser.add_argument("--years", type=int, default=YEARS)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--regenerate", action="store_true", help="Rewrite the synthetic dataset first")
+    parser.add_argument("-k", dest="keyword", help="Only run cases whose group.name contains this")
+    parser.add_argument("--rounds", type=int, help="Override every case's round count")
+    parser.add_argument("--db-url", help="Database for the ETL cases (default: SQLite file in the dataset dir)")
+    parser.add_argument("--compare", help="Baseline JSON, or 'latest' for the previous run at this scale/format")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=FutureWarning)   # the repo's "M" resample alias
+
+    root = dataset_root(args.scale, args.format, args.years)
+    manifest_path = os.path.join(root, "manifest.json")
+    if args.regenerate or not os.path.exists(manifest_path):
+        print(f"🧪 Generating {args.scale} dataset in {root} ...")
+        manifest = generate(root, SCALES[args.scale], args.years, args.format)
+    else:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    os.environ["MACRO_DATABASE_URL"] = args.db_url or f"sqlite:///{os.path.abspath(os.path.join(root, 'bench.sqlite'))}"
+
+    print(f"🏁 {manifest['fred_series']} FRED + {manifest['yahoo_series']} Yahoo series x {manifest['days']} days "
+          f"({manifest['format']})")
+    results = run_cases(Context(root, manifest), args.keyword, args.rounds)
+    saved = save_results(results, manifest, args.scale)
+    print(f"✅ Saved {saved}")
+
+    baseline = latest_result(args.scale, args.format, exclude=saved) if args.compare == "latest" else args.compare
+    if baseline:
+        regressed = compare(results, baseline, args.threshold)
+        if regressed and args.fail_on_regression:
+            sys.exit(1)
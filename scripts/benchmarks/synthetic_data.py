@@ -0,0 +1,155 @@
+# scripts/benchmarks/synthetic_data.py
+"""
+Synthetic large-universe data in the exact layouts the pipeline reads:
+
+    <root>/data/raw/fred/fred_<id>.{csv,parquet}       date,value
+    <root>/data/raw/yahoo/<label>.{csv,parquet}        date,adj_close
+    <root>/data/raw/worldbank/worldbank_us_macro.*     date,gdp_per_capita,...
+    <root>/data/processed/worldbank_us_macro.csv       (what etl.load_worldbank reads)
+    <root>/manifest.json                               generation parameters
+
+The first FRED ids and Yahoo labels are the real ones (CPIAUCNS, GDP, ...,
+sp500, gold, ...), so the loaders, analysis modules and the dashboard can run
+unchanged with `root` as the working directory. Prices are a one-factor
+geometric random walk and macro series are random walks around plausible
+levels, with a small share of missing values. Output is deterministic per seed.
+
+    python -m scripts.benchmarks.synthetic_data --scale medium --format parquet
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+SCALES = {"small": 10, "medium": 500, "large": 5000}
+YEARS = 30
+END_DATE = "2024-12-31"
+OUTPUT_ROOT = os.path.join("data", "synthetic")
+
+FRED_IDS = ["CPIAUCNS", "GDP", "UNRATE", "USSLIND"]
+YAHOO_LABELS = ["sp500", "gold", "bond10y", "eurusd", "oil", "reit_etf"]
+MISSING_SHARE = 0.005
+
+
+def universe(n_series):
+    """Split n_series into FRED ids and Yahoo labels (about one macro series per four assets)."""
+    n_fred = max(len(FRED_IDS), n_series // 5)
+    n_yahoo = max(1, n_series - n_fred)
+    fred = FRED_IDS + [f"SYN{i:05d}" for i in range(len(FRED_IDS), n_fred)]
+    yahoo = YAHOO_LABELS[:n_yahoo] + [f"asset_{i:05d}" for i in range(len(YAHOO_LABELS), n_yahoo)]
+    return fred, yahoo
+
+
+def business_days(years=YEARS, end=END_DATE):
+    end = pd.Timestamp(end)
+    return pd.bdate_range(end - pd.DateOffset(years=years) + pd.Timedelta(days=1), end)
+
+
+def _with_gaps(values, rng):
+    values = values.copy()
+    values[rng.random(values.shape) < MISSING_SHARE] = np.nan
+    return values
+
+
+def synthetic_prices(n_assets, dates, rng):
+    """T x N one-factor geometric random walk, starting between 10 and 1000."""
+    market = rng.normal(0.0003, 0.01, size=(len(dates), 1))
+    beta = rng.uniform(0.2, 1.5, size=(1, n_assets))
+    idio = rng.normal(0.0, 0.012, size=(len(dates), n_assets))
+    start = np.exp(rng.uniform(np.log(10), np.log(1000), size=(1, n_assets)))
+    return start * np.exp(np.cumsum(market * beta + idio, axis=0))
+
+
+def synthetic_macro(n_series, dates, rng):
+    """T x N random walks with small drifts around positive levels."""
+    level = rng.uniform(2.0, 300.0, size=(1, n_series))
+    steps = rng.normal(0.0, 0.002, size=(len(dates), n_series)) * level
+    return np.abs(level + np.cumsum(steps, axis=0))
+
+
+def synthetic_worldbank(dates, rng):
+    years = pd.date_range(dates[0].normalize().replace(month=1, day=1), dates[-1], freq="YS")
+    n = len(years)
+    return pd.DataFrame({
+        "date": years,
+        "gdp_per_capita": 45000 * np.cumprod(1 + rng.normal(0.02, 0.02, n)),
+        "inflation": rng.normal(2.5, 1.5, n),
+        "population": np.round(300e6 * np.cumprod(1 + rng.normal(0.007, 0.001, n))),
+        "gov_exp_pct_gdp": rng.normal(15.0, 1.0, n),
+        "unemployment_global": rng.normal(6.0, 1.2, n),
+    })
+
+
+def _write(df, path, fmt):
+    if fmt == "parquet":
+        df.to_parquet(path + ".parquet", index=False)
+    else:
+        df.to_csv(path + ".csv", index=False)
+
+
+def generate(root, n_series, years=YEARS, fmt="csv", seed=0):
+    """
+    Write a synthetic universe of n_series (FRED + Yahoo) daily series over
+    `years` years under root. Returns the manifest, also saved as manifest.json.
+    """
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"Unknown format: {fmt}")
+    rng = np.random.default_rng(seed)
+    fred_ids, yahoo_labels = universe(n_series)
+    dates = business_days(years)
+
+    dirs = {name: os.path.join(root, "data", "raw", name) for name in ("fred", "yahoo", "worldbank")}
+    processed = os.path.join(root, "data", "processed")
+    for path in list(dirs.values()) + [processed]:
+        os.makedirs(path, exist_ok=True)
+
+    macro = _with_gaps(synthetic_macro(len(fred_ids), dates, rng), rng)
+    for j, series_id in enumerate(fred_ids):
+        frame = pd.DataFrame({"date": dates, "value": macro[:, j]})
+        _write(frame, os.path.join(dirs["fred"], f"fred_{series_id.lower()}"), fmt)
+
+    prices = _with_gaps(synthetic_prices(len(yahoo_labels), dates, rng), rng)
+    for j, label in enumerate(yahoo_labels):
+        frame = pd.DataFrame({"date": dates, "adj_close": prices[:, j]})
+        _write(frame, os.path.join(dirs["yahoo"], label), fmt)
+
+    worldbank = synthetic_worldbank(dates, rng)
+    _write(worldbank, os.path.join(dirs["worldbank"], "worldbank_us_macro"), fmt)
+    worldbank.to_csv(os.path.join(processed, "worldbank_us_macro.csv"), index=False)
+
+    manifest = {
+        "root": root,
+        "format": fmt,
+        "seed": seed,
+        "years": years,
+        "days": len(dates),
+        "fred_series": len(fred_ids),
+        "yahoo_series": len(yahoo_labels),
+        "rows": len(dates) * (len(fred_ids) + len(yahoo_labels)),
+    }
+    with open(os.path.join(root, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def dataset_root(scale, fmt="csv", years=YEARS, base=OUTPUT_ROOT):
+    return os.path.join(base, f"{scale}_{years}y_{fmt}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", choices=list(SCALES), default="small")
+    parser.add_argument("--series", type=int, help="Override the scale's series count")
+    parser.add_argument("--years", type=int, default=YEARS)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Output root (default data/synthetic/<scale>_<years>y_<format>)")
+    args = parser.parse_args()
+
+    root = args.out or dataset_root(args.scale, args.format, args.years)
+    manifest = generate(root, args.series or SCALES[args.scale], args.years, args.format, args.seed)
+    print(f"✅ Wrote {manifest['fred_series']} FRED + {manifest['yahoo_series']} Yahoo series "
+          f"x {manifest['days']} days ({manifest['rows']:,} rows) to {root}")
@@ -0,0 +1,82 @@
+# scripts/data_pipeline/dashboard_charts.py
+"""
+Description:
+    Panel data and Altair chart builders shared by the Streamlit app and the
+    static snapshot export (dashboard_snapshot.py), so a prerendered chart is
+    exactly the chart the app would have drawn. No Streamlit imports here.
+"""
+
+import altair as alt
+
+FRED_SERIES = {
+    "CPI": ("CPIAUCNS", "Consumer Price Index", "Index Level"),
+    "GDP": ("GDP", "Gross Domestic Product", "Billions of Dollars"),
+    "Unemployment": ("UNRATE", "Unemployment Rate", "Percent"),
+    "CLI": ("USSLIND", "Leading Index", "Index Level"),
+}
+
+
+# ===================================================================
+# ==========  PANEL DATA  ===========================================
+# ===================================================================
+def kpi_values(store):
+    """Latest value of each FRED_SERIES indicator."""
+    return {name: float(store.series(series_id)["value"].iloc[-1])
+            for name, (series_id, _, _) in FRED_SERIES.items()}
+
+
+def asset_overlay_frame(merged, asset):
+    """Correlation of an indicator with one asset, plus the long-format overlay."""
+    correlation = merged["value"].corr(merged[asset])
+    overlay = merged.melt(
+        id_vars="date",
+        value_vars=["value", asset],
+        var_name="Series",
+        value_name="Level"
+    )
+    return correlation, overlay
+
+
+def correlation_long(corr_matrix, selected_vars):
+    """Melted sub-matrix for the heatmap."""
+    filtered = corr_matrix.loc[list(selected_vars), list(selected_vars)].reset_index().melt(id_vars="index")
+    filtered.columns = ["Variable 1", "Variable 2", "Correlation"]
+    return filtered
+
+
+# ===================================================================
+# ==========  CHARTS  ===============================================
+# ===================================================================
+def fred_trend_chart(df, label, unit):
+    return alt.Chart(df).mark_line().encode(
+        x="date:T",
+        y=alt.Y("value:Q", title=unit),
+        tooltip=["date:T","value:Q"]
+    ).properties(width=800, height=350, title=f"{label} Over Time").interactive()
+
+
+def asset_overlay_chart(overlay, label, asset):
+    return alt.Chart(overlay).mark_line().encode(
+        x="date:T",
+        y="Level:Q",
+        color="Series:N",
+        tooltip=["date:T","Series:N","Level:Q"]
+    ).properties(width=800, height=300, title=f"{label} vs {asset.upper()}")
+
+
+def worldbank_chart(wb_df, metric):
+    title = metric.replace("_"," ").title()
+    return alt.Chart(wb_df).mark_line().encode(
+        x="date:T",
+        y=alt.Y(metric, title=title),
+        tooltip=["date:T", metric]
+    ).properties(width=800, height=350, title=f"{title} Over Time")
+
+
+def correlation_chart(filtered, corr_type):
+    return alt.Chart(filtered).mark_rect().encode(
+        x="Variable 1:O",
+        y="Variable 2:O",
+        color=alt.Color("Correlation:Q", scale=alt.Scale(scheme="redblue")),
+        tooltip=["Variable 1","Variable 2","Correlation"]
+    ).properties(width=600, height=600, title=f"{corr_type} Correlation Matrix")
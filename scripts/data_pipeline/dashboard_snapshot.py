@@ -0,0 +1,141 @@
+# scripts/data_pipeline/dashboard_snapshot.py
+"""
+Description:
+    Prerendered static snapshot of the dashboard's default view. Most visits
+    never touch the controls, so after each data refresh this stage builds what
+    a visitor first sees (first FRED indicator over its full range, first
+    Yahoo asset, first World Bank metric, Pearson heatmap over all variables)
+    and writes the KPI values and Vega-Lite specs to
+
+        data/snapshots/dashboard_<data version>.json
+
+    The data version is the same source-file hash the series API uses for its
+    ETags. The app loads the snapshot matching the current version and draws
+    those panels from it on first paint; a panel is only computed once its
+    controls move off the defaults. A missing snapshot for the current version
+    (data fetched outside the app) is exported by the app on first load.
+
+    python -m scripts.data_pipeline.dashboard_snapshot [--force]
+"""
+
+import argparse
+import datetime
+import glob
+import json
+import os
+
+import pandas as pd
+
+from scripts.data_pipeline.dashboard_charts import (
+    FRED_SERIES,
+    asset_overlay_chart,
+    asset_overlay_frame,
+    correlation_chart,
+    correlation_long,
+    fred_trend_chart,
+    kpi_values,
+    worldbank_chart,
+)
+from scripts.data_pipeline.load_local_data import PROCESSED_DIR, data_version, merge_with_asset
+from scripts.data_pipeline.series_store import build_series_store
+from scripts.utils_tracing import span
+
+SNAPSHOT_DIR = os.path.join("data", "snapshots")
+SCHEMA_VERSION = 1     # bump when the snapshot layout or a chart builder changes
+KEEP_VERSIONS = 3
+
+
+def snapshot_path(version, snapshot_dir=SNAPSHOT_DIR):
+    return os.path.join(snapshot_dir, f"dashboard_{version}.json")
+
+
+def build_snapshot(store, version):
+    """KPIs, control options and default-state chart specs as a JSON-ready dict."""
+    indicator = next(iter(FRED_SERIES))
+    series_id, label, unit = FRED_SERIES[indicator]
+    fred = store.series(series_id)
+
+    prices = store.panel("yahoo")
+    assets = prices.columns.drop("date").tolist()
+    correlation, overlay = asset_overlay_frame(merge_with_asset(fred, prices, assets[0]), assets[0])
+
+    wb_df = store.panel("worldbank")
+    metrics = wb_df.columns.drop("date").tolist()
+
+    panels = {
+        "fred_trend": {"spec": fred_trend_chart(fred, label, unit).to_dict()},
+        "asset_overlay": {"spec": asset_overlay_chart(overlay, label, assets[0]).to_dict(),
+                          "correlation": float(correlation)},
+        "worldbank": {"spec": worldbank_chart(wb_df, metrics[0]).to_dict(),
+                      "latest": float(wb_df[metrics[0]].dropna().iloc[-1])},
+    }
+    variables = []
+    pearson_path = os.path.join(PROCESSED_DIR, "pearson_correlation_matrix.csv")
+    if os.path.exists(pearson_path):
+        pearson = pd.read_csv(pearson_path, index_col=0)
+        variables = pearson.columns.tolist()
+        panels["correlation_matrix"] = {
+            "spec": correlation_chart(correlation_long(pearson, variables), "Pearson").to_dict()}
+
+    bounds = {}
+    for name, (sid, _, _) in FRED_SERIES.items():
+        first, last = store.bounds(sid)
+        bounds[name] = [first.date().isoformat(), last.date().isoformat()]
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "data_version": version,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "kpis": kpi_values(store),
+        "fred_bounds": bounds,
+        "options": {"assets": assets, "worldbank_metrics": metrics, "correlation_variables": variables},
+        "panels": panels,
+    }
+
+
+def export_snapshot(store=None, snapshot_dir=SNAPSHOT_DIR, force=False, keep=KEEP_VERSIONS):
+    """Write the snapshot for the current data version (unless it exists) and prune old ones."""
+    # Versioned before reading, so data changing mid-export yields a stale
+    # version that the app will not match, never a mislabeled snapshot.
+    version = data_version()
+    path = snapshot_path(version, snapshot_dir)
+    if os.path.exists(path) and not force:
+        return path
+
+    with span("snapshot.export") as sp:
+        snapshot = build_snapshot(store or build_series_store(), version)
+        body = json.dumps(snapshot, default=str, separators=(",", ":"))
+        os.makedirs(snapshot_dir, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(body)
+        os.replace(tmp, path)    # readers never see a half-written file
+        sp.set(payload=body)
+
+    older = sorted(glob.glob(os.path.join(snapshot_dir, "dashboard_*.json")), key=os.path.getmtime)
+    for stale in older[:-keep]:
+        os.remove(stale)
+    return path
+
+
+def load_snapshot(version, snapshot_dir=SNAPSHOT_DIR):
+    """The snapshot for this data version, or None if there is no current one."""
+    path = snapshot_path(version, snapshot_dir)
+    if not os.path.exists(path):
+        return None
+    with span("snapshot.load") as sp:
+        with open(path) as f:
+            body = f.read()
+        snapshot = json.loads(body)
+        sp.set(payload=body)
+    return snapshot if snapshot.get("schema") == SCHEMA_VERSION else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--force", action="store_true", help="Rewrite the snapshot even if it is current")
+    parser.add_argument("--out", default=SNAPSHOT_DIR)
+    args = parser.parse_args()
+
+    path = export_snapshot(snapshot_dir=args.out, force=args.force)
+    print(f"✅ Dashboard snapshot: {path} ({os.path.getsize(path) / 1024:,.0f} KB)")
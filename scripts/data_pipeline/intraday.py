@@ -0,0 +1,402 @@
+# scripts/data_pipeline/intraday.py
+"""
+Description:
+    Intraday streaming mode. A pluggable tick source feeds an IntradayEngine
+    on a background thread:
+
+        source.ticks(stop) -> (symbol, timestamp, price)
+            -> per-symbol fixed-size NumPy ring buffers of ticks
+            -> bar clock (last price per symbol every bar_seconds)
+            -> rolling window of bar log returns, with running sums and
+               cross-products so rolling returns and the correlation matrix
+               are O(N^2) per bar instead of a full recompute
+
+    Every compact_every seconds the new ticks and bars are appended under
+    data/raw/intraday/ and the bar panel is published to the shared
+    SeriesStore as "intraday".
+
+    Sources:
+        ReplaySource        replays a tick frame / compacted tick CSVs (testing, demos)
+        YahooPollingSource  polls 1-minute Yahoo bars through yfinance
+"""
+
+import glob
+import os
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+INTRADAY_DIR = os.path.join("data", "raw", "intraday")
+
+Tick = namedtuple("Tick", ["symbol", "timestamp", "price"])
+
+
+# ===================================================================
+# ==========  RING BUFFERS  =========================================
+# ===================================================================
+class RingBuffer:
+    """Fixed-capacity FIFO over a preallocated NumPy array (rows may be vectors)."""
+
+    def __init__(self, capacity, width=None, dtype=float):
+        shape = (capacity,) if width is None else (capacity, width)
+        fill = np.datetime64("NaT") if np.dtype(dtype).kind == "M" else np.nan
+        self.data = np.full(shape, fill, dtype=dtype)
+        self.capacity = capacity
+        self.count = 0
+        self._head = 0   # next slot to write
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value):
+        """Write value; returns the entry it overwrote once the buffer is full (else None)."""
+        evicted = self.data[self._head].copy() if self.count == self.capacity else None
+        self.data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        return evicted
+
+    def values(self, last=None):
+        """Oldest-to-newest copy of the newest `last` entries (default all)."""
+        n = self.count if last is None else min(last, self.count)
+        start = (self._head - n) % self.capacity
+        if start + n <= self.capacity:
+            return self.data[start:start + n].copy()
+        return np.concatenate([self.data[start:], self.data[:self._head]])
+
+
+class TickBuffer:
+    """Timestamps and prices of one symbol's most recent ticks."""
+
+    def __init__(self, capacity):
+        self.times = RingBuffer(capacity, dtype="datetime64[ns]")
+        self.prices = RingBuffer(capacity)
+
+    def append(self, timestamp, price):
+        self.times.append(timestamp)
+        self.prices.append(price)
+
+    def frame(self, last=None):
+        return pd.DataFrame({"timestamp": self.times.values(last), "price": self.prices.values(last)})
+
+
+class RollingCorrelation:
+    """
+    Rolling mean/covariance/correlation of the last `window` return vectors,
+    from running sums that are updated as rows enter and leave the window. The
+    sums are rebuilt from the window every `recompute_every` updates so
+    floating-point drift can't accumulate.
+    """
+
+    def __init__(self, n, window, recompute_every=1000):
+        self.rows = RingBuffer(window, width=n)
+        self.sum = np.zeros(n)
+        self.cross = np.zeros((n, n))
+        self.recompute_every = recompute_every
+        self.updates = 0
+
+    def update(self, r):
+        evicted = self.rows.append(r)
+        self.sum += r
+        self.cross += np.outer(r, r)
+        if evicted is not None:
+            self.sum -= evicted
+            self.cross -= np.outer(evicted, evicted)
+        self.updates += 1
+        if self.updates % self.recompute_every == 0:
+            window = self.rows.values()
+            self.sum = window.sum(axis=0)
+            self.cross = window.T @ window
+
+    def rolling_return(self):
+        """Compounded simple return over the window (the rows are log returns)."""
+        return np.expm1(self.sum)
+
+    def correlation(self):
+        n = len(self.rows)
+        if n < 2:
+            return np.full(self.cross.shape, np.nan)
+        mean = self.sum / n
+        cov = self.cross / n - np.outer(mean, mean)
+        std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = cov / np.outer(std, std)
+        corr[~np.isfinite(corr)] = np.nan
+        np.fill_diagonal(corr, np.where(std > 0, 1.0, np.nan))
+        return np.clip(corr, -1.0, 1.0)
+
+
+# ===================================================================
+# ==========  ENGINE  ===============================================
+# ===================================================================
+class IntradayEngine:
+    def __init__(self, symbols, bar_seconds=60, window=390, tick_capacity=20_000, bar_capacity=5_000):
+        self.symbols = list(symbols)
+        self._col = {s: i for i, s in enumerate(self.symbols)}
+        n = len(self.symbols)
+        self.bar_delta = np.timedelta64(int(bar_seconds * 1e9), "ns")
+        self.ticks = {s: TickBuffer(tick_capacity) for s in self.symbols}
+        self.bar_times = RingBuffer(bar_capacity, dtype="datetime64[ns]")
+        self.bars = RingBuffer(bar_capacity, width=n)
+        self.stats = RollingCorrelation(n, window)
+        self.tick_count = 0
+        self._last = np.full(n, np.nan)
+        self._prev_close = np.full(n, np.nan)
+        self._bar_start = None
+        self._unflushed_ticks = dict.fromkeys(self.symbols, 0)
+        self._unflushed_bars = 0
+        self._lock = threading.Lock()
+
+    def on_tick(self, symbol, timestamp, price):
+        i = self._col.get(symbol)
+        if i is None:
+            return
+        ts = np.datetime64(pd.Timestamp(timestamp).tz_localize(None), "ns")
+        bar_start = ts - (ts - np.datetime64(0, "ns")) % self.bar_delta
+        with self._lock:
+            if self._bar_start is None:
+                self._bar_start = bar_start
+            elif bar_start > self._bar_start:
+                self._close_bar()
+                self._bar_start = bar_start
+            self.ticks[symbol].append(ts, price)
+            self._last[i] = price
+            self._unflushed_ticks[symbol] += 1
+            self.tick_count += 1
+
+    def _close_bar(self):
+        close = self._last.copy()
+        if np.isfinite(self._prev_close).any():
+            with np.errstate(invalid="ignore", divide="ignore"):
+                r = np.log(close / self._prev_close)
+            r[~np.isfinite(r)] = 0.0    # no tick yet for a symbol => flat
+            self.stats.update(r)
+        self._prev_close = close
+        self.bar_times.append(self._bar_start + self.bar_delta)
+        self.bars.append(close)
+        self._unflushed_bars += 1
+
+    def bar_frame(self, last=None):
+        with self._lock:
+            return self._bar_frame(last)
+
+    def _bar_frame(self, last=None):
+        index = pd.DatetimeIndex(self.bar_times.values(last), name="timestamp")
+        return pd.DataFrame(self.bars.values(last), index=index, columns=self.symbols)
+
+    def snapshot(self, bars=None):
+        """Consistent copy of the live state for display."""
+        with self._lock:
+            return {
+                "last_price": pd.Series(self._last.copy(), index=self.symbols),
+                "bars": self._bar_frame(bars),
+                "rolling_return": pd.Series(self.stats.rolling_return(), index=self.symbols),
+                "correlation": pd.DataFrame(self.stats.correlation(), index=self.symbols, columns=self.symbols),
+                "window_bars": len(self.stats.rows),
+                "ticks": self.tick_count,
+                "last_bar": self._bar_start,
+            }
+
+    def compact(self, out_dir=INTRADAY_DIR, store=None):
+        """
+        Append ticks and bars received since the last compaction to out_dir
+        (ticks/<symbol>.csv and bars.csv), and publish the bar panel to store.
+        Ticks that were overwritten in the ring before compaction are lost, so
+        compact more often than tick_capacity ticks arrive per symbol.
+        """
+        with self._lock:
+            ticks = {s: self.ticks[s].frame(n) for s, n in self._unflushed_ticks.items() if n}
+            new_bars = self._bar_frame(self._unflushed_bars) if self._unflushed_bars else None
+            bars = self._bar_frame() if store is not None else None
+            self._unflushed_ticks = dict.fromkeys(self.symbols, 0)
+            self._unflushed_bars = 0
+
+        if out_dir:
+            os.makedirs(os.path.join(out_dir, "ticks"), exist_ok=True)
+            for symbol, frame in ticks.items():
+                path = os.path.join(out_dir, "ticks", f"{symbol}.csv")
+                frame.to_csv(path, mode="a", header=not os.path.exists(path), index=False)
+            if new_bars is not None:
+                path = os.path.join(out_dir, "bars.csv")
+                new_bars.to_csv(path, mode="a", header=not os.path.exists(path))
+        if store is not None and bars is not None and len(bars):
+            store.add_panel("intraday", bars)
+        return sum(len(f) for f in ticks.values())
+
+
+# ===================================================================
+# ==========  SOURCES  ==============================================
+# ===================================================================
+class TickSource:
+    """Base class: ticks(stop) yields Tick tuples until exhausted or stop is set."""
+
+    def ticks(self, stop):
+        raise NotImplementedError
+
+
+class ReplaySource(TickSource):
+    """
+    Replays a timestamp/symbol/price frame, sleeping the recorded gaps divided
+    by `speed` (speed=None replays as fast as possible). With loop=True the
+    frame repeats with timestamps shifted forward and prices rescaled to carry
+    on from where the previous pass ended.
+    """
+
+    def __init__(self, frame, speed=None, loop=False):
+        self.frame = frame.sort_values("timestamp").reset_index(drop=True)
+        self.speed = speed
+        self.loop = loop
+
+    @classmethod
+    def from_csv(cls, tick_dir=os.path.join(INTRADAY_DIR, "ticks"), **kwargs):
+        """Replay compacted tick files (ticks/<symbol>.csv)."""
+        frames = []
+        for path in sorted(glob.glob(os.path.join(tick_dir, "*.csv"))):
+            df = pd.read_csv(path, parse_dates=["timestamp"])
+            df["symbol"] = os.path.splitext(os.path.basename(path))[0]
+            frames.append(df)
+        return cls(pd.concat(frames, ignore_index=True), **kwargs)
+
+    def ticks(self, stop):
+        times = self.frame["timestamp"].to_numpy(dtype="datetime64[ns]")
+        symbols = self.frame["symbol"].to_numpy()
+        prices = self.frame["price"].to_numpy(dtype=float)
+        span = times[-1] - times[0] + np.timedelta64(1, "s")
+        shift = np.timedelta64(0, "ns")
+        scale = {}
+        while not stop.is_set():
+            first, last = {}, {}
+            wall_start, t0 = time.monotonic(), times[0]
+            for ts, symbol, price in zip(times, symbols, prices):
+                if self.speed:
+                    delay = (ts - t0) / np.timedelta64(1, "s") / self.speed - (time.monotonic() - wall_start)
+                    if delay > 0 and stop.wait(delay):
+                        return
+                elif stop.is_set():
+                    return
+                first.setdefault(symbol, price)
+                last[symbol] = price * scale.get(symbol, 1.0)
+                yield Tick(symbol, ts + shift, last[symbol])
+            if not self.loop:
+                return
+            scale = {s: last[s] / first[s] for s in last}
+            shift += span
+
+
+class YahooPollingSource(TickSource):
+    """Polls the latest 1-minute Yahoo bars for {label: ticker} and yields new closes."""
+
+    def __init__(self, tickers, poll_seconds=60):
+        self.tickers = tickers
+        self.poll_seconds = poll_seconds
+
+    def ticks(self, stop):
+        import yfinance as yf
+        labels = {ticker: label for label, ticker in self.tickers.items()}
+        seen = {}
+        while not stop.is_set():
+            data = yf.download(list(labels), period="1d", interval="1m", progress=False)
+            if not data.empty:
+                closes = data["Close"]
+                if isinstance(closes, pd.Series):
+                    closes = closes.to_frame(next(iter(labels)))
+                for ticker in closes.columns:
+                    series = closes[ticker].dropna()
+                    for ts, price in series[series.index > seen.get(ticker, pd.Timestamp.min.tz_localize("UTC"))].items():
+                        yield Tick(labels[ticker], ts, float(price))
+                    if len(series):
+                        seen[ticker] = series.index[-1]
+            stop.wait(self.poll_seconds)
+
+
+def synthetic_ticks(last_prices, minutes=390, ticks_per_minute=30, annual_vol=0.2, start=None, seed=0):
+    """
+    A random-walk tick tape starting from last_prices ({symbol: price}), with
+    one common factor so the symbols are correlated. For replay demos/tests.
+    """
+    rng = np.random.default_rng(seed)
+    symbols = list(last_prices)
+    n_steps = minutes * ticks_per_minute
+    step_vol = annual_vol / np.sqrt(252 * 390 * ticks_per_minute)
+    common = rng.normal(0.0, step_vol, size=(n_steps, 1))
+    loading = rng.uniform(0.3, 0.9, size=(1, len(symbols)))
+    shocks = common * loading + rng.normal(0.0, step_vol, size=(n_steps, len(symbols))) * np.sqrt(1 - loading ** 2)
+    paths = np.array([last_prices[s] for s in symbols]) * np.exp(np.cumsum(shocks, axis=0))
+
+    start = pd.Timestamp(start or pd.Timestamp.now().floor("min"))
+    step = pd.Timedelta(minutes=1) / ticks_per_minute
+    times = start + step * np.arange(n_steps)
+    # Each symbol trades at its own offset within the step so ticks interleave
+    offsets = step * rng.uniform(0, 1, size=len(symbols))
+    frames = [pd.DataFrame({"timestamp": times + offsets[j], "symbol": s, "price": paths[:, j]})
+              for j, s in enumerate(symbols)]
+    return pd.concat(frames, ignore_index=True).sort_values("timestamp", ignore_index=True)
+
+
+# ===================================================================
+# ==========  FEED (background thread)  =============================
+# ===================================================================
+class IntradayFeed:
+    def __init__(self, engine, source, compact_every=60.0, out_dir=INTRADAY_DIR, store=None):
+        self.engine = engine
+        self.source = source
+        self.compact_every = compact_every
+        self.out_dir = out_dir
+        self.store = store
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="intraday-feed", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        next_compaction = time.monotonic() + self.compact_every
+        try:
+            for tick in self.source.ticks(self._stop):
+                self.engine.on_tick(*tick)
+                if time.monotonic() >= next_compaction:
+                    self.engine.compact(self.out_dir, self.store)
+                    next_compaction = time.monotonic() + self.compact_every
+        except Exception as e:   # surfaced to the dashboard instead of dying silently
+            self.error = e
+        finally:
+            self.engine.compact(self.out_dir, self.store)
+
+
+if __name__ == "__main__":
+    import argparse
+    from scripts.data_pipeline.load_local_data import load_yahoo_panel
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--minutes", type=int, default=390, help="Length of the synthetic session to replay")
+    parser.add_argument("--speed", type=float, default=None, help="Replay speed (default: as fast as possible)")
+    parser.add_argument("--bar-seconds", type=int, default=60)
+    parser.add_argument("--out", default=INTRADAY_DIR)
+    args = parser.parse_args()
+
+    prices = load_yahoo_panel()
+    engine = IntradayEngine(prices.columns, bar_seconds=args.bar_seconds)
+    source = ReplaySource(synthetic_ticks(prices.iloc[-1].to_dict(), minutes=args.minutes), speed=args.speed)
+    feed = IntradayFeed(engine, source, out_dir=args.out).start()
+    feed._thread.join()
+
+    snap = engine.snapshot()
+    print(f"✅ Replayed {snap['ticks']:,} ticks into {len(snap['bars'])} bars; compacted to {args.out}")
+    print("Rolling returns:\n", snap["rolling_return"].round(4).to_string())
@@ -0,0 +1,105 @@
+"""
+Description:
+    Read the CSVs written by the fetch_* scripts back into aligned, date-indexed
+    panels for the analysis modules (no database required). Parquet files with
+    the same names and columns are read too (the benchmark data generator can
+    write either).
+"""
+
+import glob
+import hashlib
+import os
+
+import pandas as pd
+
+from scripts.utils_tracing import span
+
+FRED_DIR = os.path.join("data", "raw", "fred")
+YAHOO_DIR = os.path.join("data", "raw", "yahoo")
+WORLDBANK_PATH = os.path.join("data", "raw", "worldbank", "worldbank_us_macro.csv")
+PROCESSED_DIR = os.path.join("data", "processed")
+
+# Yahoo labels that quote a yield in percent (^TNX), not a price: their changes
+# are rate moves, not returns, so return/drawdown statistics must skip them.
+YIELD_SERIES = ("bond10y",)
+CORRELATION_METHODS = ("pearson", "spearman")
+
+
+def _read_table(path):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, parse_dates=["date"])
+
+
+def _table_files(data_dir, pattern):
+    """CSV and Parquet files matching pattern (without extension), sorted by name."""
+    paths = glob.glob(os.path.join(data_dir, pattern + ".csv")) + glob.glob(os.path.join(data_dir, pattern + ".parquet"))
+    return sorted(paths, key=os.path.basename)
+
+
+def load_fred_panel(data_dir=FRED_DIR):
+    """Wide FRED panel: one column per series id (CPIAUCNS, GDP, ...), outer-joined on date."""
+    with span("load.fred_panel") as sp:
+        series = {}
+        for path in _table_files(data_dir, "fred_*"):
+            series_id = os.path.splitext(os.path.basename(path))[0].replace("fred_", "").upper()
+            df = _read_table(path)
+            series[series_id] = df.dropna().set_index("date")["value"]
+
+        panel = pd.concat(series, axis=1).sort_index()
+        panel.index.name = "date"
+        sp.set(rows=len(panel), payload=panel)
+    return panel
+
+
+def load_yahoo_panel(data_dir=YAHOO_DIR, how="inner"):
+    """Wide Yahoo price panel: one column per asset label (sp500, gold, ...), aligned on date."""
+    with span("load.yahoo_panel") as sp:
+        prices = {}
+        for path in _table_files(data_dir, "*"):
+            label = os.path.splitext(os.path.basename(path))[0]
+            df = _read_table(path)
+            prices[label] = df.dropna().set_index("date")["adj_close"]
+
+        panel = pd.concat(prices, axis=1, join=how).sort_index()
+        panel.index.name = "date"
+        sp.set(rows=len(panel), payload=panel)
+    return panel
+
+
+def load_worldbank_panel(path=WORLDBANK_PATH):
+    """Annual World Bank indicators indexed by date."""
+    with span("load.worldbank_panel") as sp:
+        panel = _read_table(path).set_index("date").sort_index()
+        sp.set(rows=len(panel), payload=panel)
+    return panel
+
+
+def merge_with_asset(series, prices, asset):
+    """Inner-join a date/value frame with one asset column of a date-column price panel."""
+    with span("load.merge_with_asset") as sp:
+        merged = pd.merge(series, prices[["date", asset]], on="date", how="inner")
+        sp.set(rows=len(merged), payload=merged)
+    return merged
+
+
+def to_monthly(panel):
+    """Month-end sample of a date-indexed panel (last observation in each month)."""
+    return panel.resample("M").last()
+
+
+def source_files():
+    """Every raw file plus the saved correlation matrices: the inputs the dashboard and API read."""
+    files = glob.glob(os.path.join(FRED_DIR, "*")) + glob.glob(os.path.join(YAHOO_DIR, "*"))
+    files += [WORLDBANK_PATH]
+    files += [os.path.join(PROCESSED_DIR, f"{m}_correlation_matrix.csv") for m in CORRELATION_METHODS]
+    return sorted(f for f in files if os.path.isfile(f))
+
+
+def data_version():
+    """Short hash of every source file's path, size and mtime."""
+    digest = hashlib.sha1()
+    for path in source_files():
+        stat = os.stat(path)
+        digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
@@ -0,0 +1,110 @@
+"""
+Description:
+    Process-wide, read-only in-memory store for the local series.
+
+    Each series/panel is held once as sorted NumPy arrays with the writeable
+    flag cleared. Date-range requests are resolved with searchsorted (O(log n))
+    and returned as DataFrames built over views of those arrays, so callers
+    share one copy of the data instead of each getting their own. Writes
+    through a returned frame raise "assignment destination is read-only";
+    derive new columns with .assign() instead.
+"""
+
+import numpy as np
+import pandas as pd
+
+from scripts.data_pipeline.load_local_data import (
+    FRED_DIR, WORLDBANK_PATH, YAHOO_DIR,
+    load_fred_panel, load_worldbank_panel, load_yahoo_panel,
+)
+
+
+def _frozen(array):
+    array = np.array(array, copy=True)
+    array.flags.writeable = False
+    return array
+
+
+class SeriesStore:
+    def __init__(self):
+        self._series = {}   # name -> (dates, values)
+        self._panels = {}   # name -> (dates, values[T, N], columns)
+
+    # ---------- building ----------
+    def add_series(self, name, dates, values):
+        dates = np.asarray(dates, dtype="datetime64[ns]")
+        order = np.argsort(dates, kind="stable")
+        self._series[name] = (_frozen(dates[order]), _frozen(np.asarray(values, dtype=float)[order]))
+
+    def add_panel(self, name, frame):
+        """Add a date-indexed wide DataFrame."""
+        frame = frame.sort_index()
+        self._panels[name] = (
+            _frozen(frame.index.values.astype("datetime64[ns]")),
+            _frozen(frame.to_numpy(dtype=float)),
+            list(frame.columns),
+        )
+
+    # ---------- lookups ----------
+    @staticmethod
+    def _window(dates, start, end):
+        lo = 0 if start is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(start)), side="left")
+        hi = len(dates) if end is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(end)), side="right")
+        return slice(lo, hi)
+
+    def names(self):
+        return list(self._series), list(self._panels)
+
+    def columns(self, panel):
+        return list(self._panels[panel][2])
+
+    def bounds(self, name, column=None):
+        """First and last date of a series or panel (or of one panel column's non-missing values)."""
+        if name in self._series:
+            dates = self._series[name][0]
+        else:
+            dates, values, columns = self._panels[name]
+            if column is not None:
+                dates = dates[~np.isnan(values[:, columns.index(column)])]
+        return pd.Timestamp(dates[0]), pd.Timestamp(dates[-1])
+
+    def series(self, name, start=None, end=None):
+        """date/value DataFrame over views of the stored arrays."""
+        dates, values = self._series[name]
+        window = self._window(dates, start, end)
+        return pd.DataFrame({"date": dates[window], "value": values[window]}, copy=False)
+
+    def panel(self, name, start=None, end=None, columns=None):
+        """Wide DataFrame with a leading date column; every column is a view."""
+        dates, values, all_columns = self._panels[name]
+        window = self._window(dates, start, end)
+        columns = all_columns if columns is None else columns
+        data = {"date": dates[window]}
+        for col in columns:
+            data[col] = values[window, all_columns.index(col)]
+        return pd.DataFrame(data, copy=False)
+
+    @property
+    def nbytes(self):
+        total = sum(d.nbytes + v.nbytes for d, v in self._series.values())
+        return total + sum(d.nbytes + v.nbytes for d, v, _ in self._panels.values())
+
+
+def build_series_store(fred_dir=FRED_DIR, yahoo_dir=YAHOO_DIR, worldbank_path=WORLDBANK_PATH):
+    """Load every local source once into a SeriesStore."""
+    store = SeriesStore()
+
+    fred = load_fred_panel(fred_dir)
+    for series_id in fred.columns:
+        series = fred[series_id].dropna()
+        store.add_series(series_id, series.index.values, series.values)
+
+    # The panel is inner-joined (aligned returns for the dashboard); each symbol
+    # is also kept on its own dates as "yahoo:<label>" so nothing is dropped.
+    yahoo = load_yahoo_panel(yahoo_dir, how="outer")
+    store.add_panel("yahoo", yahoo.dropna())
+    for label in yahoo.columns:
+        series = yahoo[label].dropna()
+        store.add_series(f"yahoo:{label}", series.index.values, series.values)
+    store.add_panel("worldbank", load_worldbank_panel(worldbank_path))
+    return store
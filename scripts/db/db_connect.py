@@ -1,5 +1,7 @@
 # scripts/db/db_connect.py
 
+import os
+
 from sqlalchemy import create_engine
 
 DB_USER = "postgres"
@@ -8,6 +10,30 @@ DB_HOST = "localhost"
 DB_PORT = "5432"
 DB_NAME = "macro_dashboard"
 
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# MACRO_DATABASE_URL overrides the local Postgres default (e.g. sqlite:///bench.db)
+DATABASE_URL = os.getenv(
+    "MACRO_DATABASE_URL",
+    f"postgresql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
+)
+
+# Analysis storage: "postgres" (the tables above) or "duckdb" (query the
+# CSV/Parquet files in place, in-process; see scripts/db/duckdb_backend.py)
+STORAGE_BACKEND = os.getenv("MACRO_STORAGE_BACKEND", "postgres")
+DUCKDB_PATH = os.getenv("MACRO_DUCKDB_PATH", ":memory:")
+
+_engine = None
+
+
+def get_engine():
+    """The SQLAlchemy engine, created on first use so importing the settings needs no DB driver."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL)
+    return _engine
+
 
-engine = create_engine(DATABASE_URL)
+def __getattr__(name):
+    # `from scripts.db.db_connect import engine` keeps working, lazily
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
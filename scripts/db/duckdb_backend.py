@@ -0,0 +1,162 @@
+# scripts/db/duckdb_backend.py
+"""
+Embedded DuckDB backend: queries the raw/processed CSV (or Parquet) files in
+place, in-process, with no database server.
+
+The views mirror the Postgres tables the ETL fills:
+
+    yahoo_assets(date, symbol, adj_close)         <- data/raw/yahoo/*
+    fred_indicators(date, indicator, value)       <- data/raw/fred/fred_*
+    macro_indicators(date, gdp_per_capita, ...)   <- data/processed/worldbank_us_macro.csv
+
+load_correlation_input() builds the same monthly panel as the pandas code in
+correlation_matrix.load_and_prepare_data, but the month-end resampling, the
+World Bank forward fill (an ASOF join), the 60% coverage filter and the pivot
+run as SQL: one scan of the files into a small month x series table, then a
+filtered PIVOT of it.
+"""
+
+import glob
+import os
+
+import duckdb
+import pandas as pd
+
+from scripts.db.db_connect import DUCKDB_PATH
+from scripts.utils_tracing import span
+
+FRED_DIR = os.path.join("data", "raw", "fred")
+YAHOO_DIR = os.path.join("data", "raw", "yahoo")
+WORLDBANK_CSV = os.path.join("data", "processed", "worldbank_us_macro.csv")
+
+MIN_COVERAGE = 0.6   # same row filter as load_and_prepare_data
+
+# The file layouts are fixed, so CSVs are read with explicit schemas; letting
+# DuckDB sniff every file costs far more than reading it.
+YAHOO_SCHEMA = {"date": "VARCHAR", "adj_close": "DOUBLE"}
+FRED_SCHEMA = {"date": "DATE", "value": "DOUBLE"}
+WORLDBANK_SCHEMA = {
+    "date": "DATE",
+    "gdp_per_capita": "DOUBLE",
+    "inflation": "DOUBLE",
+    "population": "DOUBLE",
+    "gov_exp_pct_gdp": "DOUBLE",
+    "unemployment_global": "DOUBLE",
+}
+
+
+def connect(path=DUCKDB_PATH):
+    return duckdb.connect(path)
+
+
+def _scan(con, pattern, schema):
+    """Relation over every CSV and Parquet file matching pattern (without extension)."""
+    csv = sorted(glob.glob(pattern + ".csv"))
+    parquet = sorted(glob.glob(pattern + ".parquet"))
+    if not csv and not parquet:
+        raise FileNotFoundError(f"No CSV or Parquet files match {pattern}")
+    relations = []
+    if csv:
+        relations.append(con.read_csv(csv, header=True, columns=schema, auto_detect=False,
+                                      null_padding=True, filename=True))
+    if parquet:
+        casts = ", ".join(f'CAST("{c}" AS {t}) AS "{c}"' for c, t in schema.items())
+        relations.append(con.read_parquet(parquet, filename=True, union_by_name=True).project(casts + ", filename"))
+    return relations[0] if len(relations) == 1 else relations[0].union(relations[1])
+
+
+def register_sources(con, fred_dir=FRED_DIR, yahoo_dir=YAHOO_DIR, worldbank_path=WORLDBANK_CSV):
+    """Create the three source views on con. Returns the World Bank value columns."""
+    _scan(con, os.path.join(yahoo_dir, "*"), YAHOO_SCHEMA).create_view("yahoo_files", replace=True)
+    _scan(con, os.path.join(fred_dir, "fred_*"), FRED_SCHEMA).create_view("fred_files", replace=True)
+    _scan(con, os.path.splitext(worldbank_path)[0], WORLDBANK_SCHEMA).create_view("worldbank_files", replace=True)
+
+    con.execute("""
+        CREATE OR REPLACE VIEW yahoo_assets AS
+        SELECT TRY_CAST(date AS DATE) AS date,
+               upper(parse_filename(filename, true)) AS symbol,
+               CAST(adj_close AS DOUBLE) AS adj_close
+        FROM yahoo_files
+        WHERE TRY_CAST(date AS DATE) IS NOT NULL AND adj_close IS NOT NULL
+    """)
+    con.execute("""
+        CREATE OR REPLACE VIEW fred_indicators AS
+        SELECT CAST(date AS DATE) AS date,
+               upper(regexp_replace(parse_filename(filename, true), '^fred_', '')) AS indicator,
+               CAST(value AS DOUBLE) AS value
+        FROM fred_files
+        WHERE date IS NOT NULL AND value IS NOT NULL
+    """)
+    con.execute("""
+        CREATE OR REPLACE VIEW macro_indicators AS
+        SELECT CAST(date AS DATE) AS date, * EXCLUDE (date, filename)
+        FROM worldbank_files
+    """)
+    return [c for c in con.table("macro_indicators").columns if c != "date"]
+
+
+MONTHLY_LONG_SQL = """
+CREATE OR REPLACE TEMP TABLE monthly_long AS
+WITH
+worldbank_months AS (
+    SELECT last_day(CAST(m AS DATE)) AS month
+    FROM range(
+        (SELECT date_trunc('month', min(date)) FROM macro_indicators),
+        (SELECT date_trunc('month', max(date)) FROM macro_indicators) + INTERVAL 1 MONTH,
+        INTERVAL 1 MONTH
+    ) AS t(m)
+),
+worldbank_monthly AS (          -- resample("M").ffill(): latest annual row at or before each month end
+    SELECT w.month, mi.* EXCLUDE (date)
+    FROM worldbank_months w ASOF JOIN macro_indicators mi ON w.month >= mi.date
+)
+-- resample("M").last(): latest non-null value in each month
+SELECT 0 AS source, last_day(date) AS month, symbol AS name, arg_max(adj_close, date) AS value
+FROM yahoo_assets GROUP BY ALL
+UNION ALL
+SELECT 1 AS source, last_day(date) AS month, indicator AS name, arg_max(value, date) AS value
+FROM fred_indicators GROUP BY ALL
+UNION ALL
+SELECT 2 AS source, month, name, value
+FROM (UNPIVOT worldbank_monthly ON COLUMNS(* EXCLUDE (month)) INTO NAME name VALUE value)
+"""
+
+PANEL_SQL = """
+WITH kept AS (                  -- dropna(thresh=...)
+    SELECT month FROM monthly_long GROUP BY month HAVING count(value) >= $thresh
+)
+PIVOT (SELECT month, name, value FROM monthly_long SEMI JOIN kept USING (month))
+ON name USING first(value)
+GROUP BY month
+ORDER BY month
+"""
+
+
+def load_correlation_input(con=None, fred_dir=FRED_DIR, yahoo_dir=YAHOO_DIR, worldbank_path=WORLDBANK_CSV):
+    """
+    Monthly merged panel for the correlation matrix, computed in DuckDB.
+
+    Uses con if given (left open for the caller), else opens and closes its own.
+    """
+    owned = con is None
+    con = con or connect()
+    try:
+        with span("corr.duckdb_monthly") as sp:
+            worldbank_columns = register_sources(con, fred_dir, yahoo_dir, worldbank_path)
+            con.execute(MONTHLY_LONG_SQL)
+            names = con.sql("SELECT DISTINCT source, name FROM monthly_long WHERE source < 2 ORDER BY ALL").fetchall()
+            sp.set(rows=con.sql("SELECT count(*) FROM monthly_long").fetchone()[0])
+        # Column order of the pandas path: sorted symbols, sorted indicators, World Bank columns
+        columns = [name for _, name in names] + worldbank_columns
+
+        with span("corr.duckdb_panel") as sp:
+            # PIVOT doesn't take prepared parameters, so the threshold is inlined
+            thresh = int(len(columns) * MIN_COVERAGE)
+            df = con.sql(PANEL_SQL.replace("$thresh", str(thresh))).df()
+            df = df.set_index(pd.DatetimeIndex(df.pop("month"), name="date").astype("datetime64[ns]"))
+            df = df.reindex(columns=columns).astype(float)
+            sp.set(rows=len(df), payload=df)
+        return df
+    finally:
+        if owned:
+            con.close()
@@ -2,13 +2,24 @@ import argparse
 import pandas as pd
 from scripts.db.db_connect import engine
 from sqlalchemy import text
+from scripts.utils_tracing import span
 import os
 
-def load_worldbank():
+WORLDBANK_CSV = "data/processed/worldbank_us_macro.csv"
+FRED_FILES = {
+    "CPIAUCNS": "data/raw/fred/fred_cpiaucns.csv",
+    "GDP": "data/raw/fred/fred_gdp.csv",
+    "UNRATE": "data/raw/fred/fred_unrate.csv",
+    "USSLIND": "data/raw/fred/fred_usslind.csv"
+}
+YAHOO_DIR = "data/raw/yahoo"
+
+def load_worldbank(db=engine, path=WORLDBANK_CSV):
     print("🌍 Loading World Bank data...")
-    df = pd.read_csv("data/processed/worldbank_us_macro.csv", parse_dates=["date"])
+    df = pd.read_csv(path, parse_dates=["date"])
+    df["date"] = df["date"].dt.date  # plain dates bind on both Postgres and SQLite
 
-    with engine.begin() as conn:
+    with span("etl.worldbank.insert", rows=len(df), payload=df), db.begin() as conn:
         conn.execute(text("DELETE FROM macro_indicators"))
         conn.execute(
             text("""
@@ -23,16 +34,9 @@ def load_worldbank():
 
     print("✅ World Bank data inserted successfully.")
 
-def load_fred():
+def load_fred(db=engine, indicators=FRED_FILES):
     print("📦 Loading FRED data...")
 
-    indicators = {
-        "CPIAUCNS": "data/raw/fred/fred_cpiaucns.csv",
-        "GDP": "data/raw/fred/fred_gdp.csv",
-        "UNRATE": "data/raw/fred/fred_unrate.csv",
-        "USSLIND": "data/raw/fred/fred_usslind.csv"
-    }
-
     dfs = []
     for series_id, path in indicators.items():
         df = pd.read_csv(path, parse_dates=["date"])
@@ -41,8 +45,9 @@ def load_fred():
         dfs.append(df)
 
     combined = pd.concat(dfs)
+    combined["date"] = combined["date"].dt.date
 
-    with engine.begin() as conn:
+    with span("etl.fred.insert", rows=len(combined), payload=combined), db.begin() as conn:
         conn.execute(text("DELETE FROM fred_indicators"))
         conn.execute(
             text("""
@@ -54,10 +59,9 @@ def load_fred():
 
     print("✅ FRED data inserted into fred_indicators.")
 
-def load_yahoo():
+def load_yahoo(db=engine, yahoo_dir=YAHOO_DIR):
     print("💹 Loading Yahoo Finance asset data...")
 
-    yahoo_dir = "data/raw/yahoo"
     dfs = []
 
     for filename in os.listdir(yahoo_dir):
@@ -86,8 +90,9 @@ def load_yahoo():
         return
 
     combined = pd.concat(dfs, ignore_index=True)[["date", "symbol", "adj_close"]]
+    combined["date"] = combined["date"].dt.date
 
-    with engine.begin() as conn:
+    with span("etl.yahoo.insert", rows=len(combined), payload=combined), db.begin() as conn:
         conn.execute(text("DELETE FROM yahoo_assets"))
         conn.execute(
             text("""
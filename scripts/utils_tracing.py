@@ -0,0 +1,197 @@
+"""
+Description:
+    Lightweight span tracing for the dashboard, loaders, ETL and analysis code.
+
+        with span("load.fred_panel") as sp:
+            panel = ...
+            sp.set(rows=len(panel), payload=panel)
+
+    Each span records wall time, rows processed and payload bytes. Tracing is
+    on for the whole process when MACRO_TRACE=1, or for the current thread
+    between start_trace() and stop_trace() (the dashboard's performance
+    overlay). With MACRO_TRACE_FILE set, every finished span is also appended
+    there as a JSON line.
+
+    When tracing is off, span() returns a shared no-op object (falsy, so
+    `if sp:` can guard any expensive measurement), and the cost is one
+    function call.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+_enabled = os.getenv("MACRO_TRACE", "") not in ("", "0")
+_trace_file = os.getenv("MACRO_TRACE_FILE")
+
+_recent = deque(maxlen=10_000)           # process-wide ring of finished spans
+_lock = threading.Lock()
+_active = contextvars.ContextVar("macro_trace_active", default=None)
+_stack = contextvars.ContextVar("macro_trace_stack", default=())
+
+
+def payload_bytes(obj):
+    """Best-effort in-memory size of a payload (shallow for DataFrames)."""
+    if obj is None:
+        return None
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(index=True)
+        return int(usage.sum() if isinstance(obj, pd.DataFrame) else usage)
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, (bytes, bytearray)):
+        return len(obj)
+    if isinstance(obj, str):
+        return len(obj.encode("utf-8"))
+    if isinstance(obj, (tuple, list)):
+        return sum(payload_bytes(o) or 0 for o in obj)
+    return None
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __bool__(self):
+        return False
+
+    def set(self, **fields):
+        return self
+
+
+_NOOP = _NoopSpan()
+
+
+class Span:
+    __slots__ = ("name", "rows", "bytes", "extra", "_start", "_wall", "_token", "_sink")
+
+    def __init__(self, name, sink, rows=None, payload=None):
+        self.name = name
+        self.rows = rows
+        self.bytes = payload_bytes(payload)
+        self.extra = {}
+        self._sink = sink
+
+    def __enter__(self):
+        self._token = _stack.set(_stack.get() + (self.name,))
+        self._wall = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._start
+        parents = _stack.get()[:-1]
+        _stack.reset(self._token)
+        record = {
+            "name": self.name,
+            "start": self._wall,
+            "wall_ms": round(elapsed * 1000.0, 3),
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "parent": parents[-1] if parents else None,
+            "depth": len(parents),
+            "thread": threading.current_thread().name,
+            "error": exc_type.__name__ if exc_type else None,
+            **self.extra,
+        }
+        _emit(record, self._sink)
+        return False
+
+    def __bool__(self):
+        return True
+
+    def set(self, rows=None, payload=None, **extra):
+        if rows is not None:
+            self.rows = int(rows)
+        if payload is not None:
+            self.bytes = payload_bytes(payload)
+        self.extra.update(extra)
+        return self
+
+
+def _emit(record, sink):
+    if sink is not None:
+        sink.append(record)
+    with _lock:
+        _recent.append(record)
+        if _trace_file:
+            with open(_trace_file, "a") as f:
+                f.write(json.dumps(record, default=str) + "\n")
+
+
+def span(name, rows=None, payload=None):
+    """Context manager timing a block; a shared no-op unless tracing is on."""
+    sink = _active.get()
+    if sink is None and not _enabled:
+        return _NOOP
+    return Span(name, sink, rows, payload)
+
+
+def traced(name):
+    """Decorator form of span() for whole functions."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable(flag=True):
+    """Turn process-wide tracing on or off."""
+    global _enabled
+    _enabled = bool(flag)
+
+
+def is_enabled():
+    return _enabled or _active.get() is not None
+
+
+def collecting():
+    """True while start_trace() is collecting in the current context."""
+    return _active.get() is not None
+
+
+def start_trace():
+    """Collect spans from the current thread/context into a fresh list."""
+    _active.set([])
+
+
+def stop_trace():
+    """Stop collecting for the current context and return the spans collected."""
+    spans = _active.get() or []
+    _active.set(None)
+    return spans
+
+
+def recent_spans():
+    with _lock:
+        return list(_recent)
+
+
+def clear():
+    with _lock:
+        _recent.clear()
+
+
+def to_jsonl(spans):
+    return "".join(json.dumps(s, default=str) + "\n" for s in spans)
+
+
+def export_jsonl(path, spans=None):
+    """Write spans (default: the process-wide ring) to a JSONL file."""
+    with open(path, "w") as f:
+        f.write(to_jsonl(recent_spans() if spans is None else spans))
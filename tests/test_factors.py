@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.analysis.factors import factor_series, fit_factors, update_factors
+
+
+def _returns(n_days, n_assets=6, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2020-01-01", periods=n_days)
+    return pd.DataFrame(rng.normal(0, 0.01, (n_days, n_assets)), index=index,
+                        columns=[f"a{i}" for i in range(n_assets)])
+
+
+def test_small_updates_are_not_applied_twice():
+    returns = _returns(300)
+    state = fit_factors(returns.iloc[:250], n_components=5)
+
+    # Two consecutive updates each smaller than n_components: the first is
+    # stashed, the second must only add the days after it.
+    assert update_factors(state, returns.iloc[:253]).empty
+    applied = update_factors(state, returns.iloc[:256])
+
+    assert len(applied) == 6
+    assert not applied.index.has_duplicates
+    assert applied.index.equals(returns.index[250:256])
+    assert state["last_date"] == returns.index[255]
+    assert state["pending"].empty
+
+
+def test_factor_series_covers_history_once():
+    returns = _returns(300)
+    state = fit_factors(returns.iloc[:250], n_components=5)
+    update_factors(state, returns.iloc[:253])
+    update_factors(state, returns)
+
+    series = factor_series(state, returns.loc[:state["last_date"]])
+    assert not series.index.has_duplicates
+    assert len(series) == len(returns)
+
+
+def test_new_assets_warn_until_refit():
+    returns = _returns(300)
+    state = fit_factors(returns.iloc[:250, :5], n_components=3)
+
+    with pytest.warns(UserWarning, match="a5"):
+        applied = update_factors(state, returns)
+    assert list(applied.columns) == state["assets"]
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from scripts.analysis.lead_lag import run_lead_lag
+
+
+def _panels(n_months=120, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2010-01-01", periods=n_months, freq="MS")
+    macro = pd.DataFrame({
+        "UNRATE": 5.0 + rng.normal(0, 0.2, n_months).cumsum(),
+        "USSLIND": 1.0 + rng.normal(0, 0.1, n_months).cumsum(),
+    }, index=index)
+    prices = pd.DataFrame(
+        100.0 * np.exp(rng.normal(0, 0.03, (n_months, 3)).cumsum(0)),
+        index=index, columns=["sp500", "gold", "bond10y"],
+    )
+    return macro, prices
+
+
+def test_discontinued_indicator_is_blank_not_fatal():
+    macro, prices = _panels()
+    macro.loc["2015-01-01":, "USSLIND"] = np.nan      # series stops before the price window
+    table = run_lead_lag(macro, prices.loc["2016-01-01":], max_horizon=3, min_train=12)
+
+    dead = table[table["indicator"] == "USSLIND"]
+    live = table[table["indicator"] == "UNRATE"]
+    assert (dead["nobs"] == 0).all()
+    assert dead[["alpha", "beta", "se_beta", "t_stat", "r2"]].isna().all().all()
+    assert live[["beta", "t_stat"]].notna().all().all()
+
+
+def test_yield_series_are_not_treated_as_prices():
+    macro, prices = _panels()
+    table = run_lead_lag(macro, prices, max_horizon=3, min_train=12)
+    assert set(table["asset"]) == {"sp500", "gold"}